@@ -9,7 +9,6 @@
 from __future__ import annotations
 
 import enum
-import functools
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
@@ -701,12 +700,16 @@ class Location(CamelSnakeMixin):
     """Represents a location inside a resource, such as a line
     inside a text file."""
 
+    __slots__ = ("range", "uri")
+
     uri: DocumentUri
 
     range: Range
 
     def __hash__(self) -> int:
-        return hash((self.uri, self.range))
+        start = self.range.start
+        end = self.range.end
+        return hash((self.uri, start.line, start.character, end.line, end.character))
 
 
 @dataclass
@@ -3933,6 +3936,8 @@ class Range(CamelSnakeMixin):
     }
     ```"""
 
+    __slots__ = ("end", "start")
+
     start: Position
     """The range's start position."""
 
@@ -3944,17 +3949,11 @@ class Range(CamelSnakeMixin):
 
     @staticmethod
     def zero() -> Range:
-        return Range(
-            start=Position(line=0, character=0),
-            end=Position(line=0, character=0),
-        )
+        return Range(Position(0, 0), Position(0, 0))
 
     @staticmethod
     def invalid() -> Range:
-        return Range(
-            start=Position(line=-1, character=-1),
-            end=Position(line=-1, character=-1),
-        )
+        return Range(Position(-1, -1), Position(-1, -1))
 
     def extend(
         self,
@@ -3963,15 +3962,11 @@ class Range(CamelSnakeMixin):
         end_line: int = 0,
         end_character: int = 0,
     ) -> Range:
+        start = self.start
+        end = self.end
         return Range(
-            start=Position(
-                line=self.start.line + start_line,
-                character=self.start.character + start_character,
-            ),
-            end=Position(
-                line=self.end.line + end_line,
-                character=self.end.character + end_character,
-            ),
+            Position(start.line + start_line, start.character + start_character),
+            Position(end.line + end_line, end.character + end_character),
         )
 
     def __bool__(self) -> bool:
@@ -3986,7 +3981,9 @@ class Range(CamelSnakeMixin):
         return self.start.is_in_range(range, include_end) and self.end.is_in_range(range, include_end)
 
     def __hash__(self) -> int:
-        return hash((self.start, self.end))
+        start = self.start
+        end = self.end
+        return hash((start.line, start.character, end.line, end.character))
 
 
 @dataclass
@@ -4035,7 +4032,6 @@ class Color(CamelSnakeMixin):
 
 
 @dataclass
-@functools.total_ordering
 class Position(CamelSnakeMixin):
     """Position in a text document expressed as zero-based line and character
     offset. Prior to 3.17 the offsets were always based on a UTF-16 string
@@ -4067,6 +4063,8 @@ class Position(CamelSnakeMixin):
 
     # Since: 3.17.0 - support for negotiated position encoding.
 
+    __slots__ = ("character", "line")
+
     line: int
     """Line position in a document (zero-based).
 
@@ -4085,20 +4083,41 @@ class Position(CamelSnakeMixin):
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, Position):
             return NotImplemented
-        return (self.line, self.character) == (o.line, o.character)
+        return self.line == o.line and self.character == o.character
 
     def __gt__(self, o: object) -> bool:
         if not isinstance(o, Position):
             return NotImplemented
-        return (self.line, self.character) > (o.line, o.character)
+        return self.line > o.line or (self.line == o.line and self.character > o.character)
+
+    def __ge__(self, o: object) -> bool:
+        if not isinstance(o, Position):
+            return NotImplemented
+        return self.line > o.line or (self.line == o.line and self.character >= o.character)
+
+    def __lt__(self, o: object) -> bool:
+        if not isinstance(o, Position):
+            return NotImplemented
+        return self.line < o.line or (self.line == o.line and self.character < o.character)
+
+    def __le__(self, o: object) -> bool:
+        if not isinstance(o, Position):
+            return NotImplemented
+        return self.line < o.line or (self.line == o.line and self.character <= o.character)
 
     def __iter__(self) -> Iterator[int]:
         return iter((self.line, self.character))
 
     def is_in_range(self, range: Range, include_end: bool = True) -> bool:
+        line = self.line
+        start = range.start
+        if line < start.line or (line == start.line and self.character < start.character):
+            return False
+
+        end = range.end
         if include_end:
-            return range.start <= self <= range.end
-        return range.start <= self < range.end
+            return line < end.line or (line == end.line and self.character <= end.character)
+        return line < end.line or (line == end.line and self.character < end.character)
 
     def __hash__(self) -> int:
         return hash((self.line, self.character))
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import astuple, dataclass, fields
+import sys
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, Iterator, Mapping, Optional, Union, overload
 from urllib import parse
@@ -28,7 +29,7 @@ class _Parts:
     fragment: str = ""
 
     def __iter__(self) -> Iterator[str]:
-        yield from astuple(self)
+        return iter((self.scheme, self.netloc, self.path, self.params, self.query, self.fragment))
 
     def __hash__(self) -> int:
         return hash(
@@ -95,9 +96,13 @@ class Uri(Mapping[str, str]):
         self._parts.scheme = self._parts.scheme or _DEFAULT_SCHEME
 
         self._path: Optional[Path] = None
+        self._str: Optional[str] = None
 
     def __str__(self) -> str:
-        return parse.urlunparse(tuple(self._parts))
+        if self._str is None:
+            self._str = sys.intern(parse.urlunparse(tuple(self._parts)))
+
+        return self._str
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({parse.urlunparse(tuple(self._parts))!r})"
@@ -5,11 +5,14 @@ import functools
 import inspect
 import itertools
 import json
+import operator
 import re
+import sys
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Literal,
@@ -42,44 +45,31 @@ _RE_SNAKE_CASE_1 = re.compile(r"[\-\.\s]")
 _RE_SNAKE_CASE_2 = re.compile(r"[A-Z]")
 
 
-__not_valid = object()
-
-__to_snake_case_cache: Dict[str, str] = {}
-
-
 @functools.lru_cache(maxsize=None)
 def to_snake_case(s: str) -> str:
-    result = __to_snake_case_cache.get(s, __not_valid)
-    if result is __not_valid:
-        s = _RE_SNAKE_CASE_1.sub("_", s)
-        if not s:
-            result = s
-        else:
-            result = s[0].lower() + _RE_SNAKE_CASE_2.sub(lambda matched: "_" + matched.group(0).lower(), s[1:])
-        __to_snake_case_cache[s] = result
-    return cast(str, result)
+    s = _RE_SNAKE_CASE_1.sub("_", s)
+    if not s:
+        return s
+
+    return s[0].lower() + _RE_SNAKE_CASE_2.sub(lambda matched: "_" + matched.group(0).lower(), s[1:])
 
 
 _RE_CAMEL_CASE_1 = re.compile(r"^[\-_\.]")
 _RE_CAMEL_CASE_2 = re.compile(r"[\-_\.\s]([a-z])")
 
-__to_snake_camel_cache: Dict[str, str] = {}
-
 
 @functools.lru_cache(maxsize=None)
 def to_camel_case(s: str) -> str:
-    result = __to_snake_camel_cache.get(s, __not_valid)
-    if result is __not_valid:
-        s = _RE_CAMEL_CASE_1.sub("", s)
-        if not s:
-            result = s
-        else:
-            result = str(s[0]).lower() + _RE_CAMEL_CASE_2.sub(lambda matched: str(matched.group(1)).upper(), s[1:])
-        __to_snake_camel_cache[s] = result
-    return cast(str, result)
+    s = _RE_CAMEL_CASE_1.sub("", s)
+    if not s:
+        return s
+
+    return str(s[0]).lower() + _RE_CAMEL_CASE_2.sub(lambda matched: str(matched.group(1)).upper(), s[1:])
 
 
 class CamelSnakeMixin:
+    __slots__ = ()
+
     @classmethod
     def _encode_case(cls, s: str) -> str:
         return to_camel_case(s)
@@ -112,9 +102,9 @@ def encode_case_for_field_name(obj: Any, field: dataclasses.Field) -> str:  # ty
     if name is __NOT_SET:
         alias = field.metadata.get("alias", None)
         if alias:
-            name = str(alias)
+            name = sys.intern(str(alias))
         elif hasattr(obj, "_encode_case"):
-            name = str(obj._encode_case(field.name))
+            name = sys.intern(str(obj._encode_case(field.name)))
         else:
             name = field.name
         __field_name_cache[(t, field)] = name
@@ -161,36 +151,92 @@ def get_dataclass_fields(t: Type[Any]) -> Tuple[dataclasses.Field, ...]:  # type
     return fields
 
 
-def _default(o: Any) -> Any:
-    if dataclasses.is_dataclass(o):
-        return {
-            name: value
-            for name, value, field in (
-                (
-                    encode_case_for_field_name(o, field),
-                    getattr(o, field.name),
-                    field,
-                )
-                for field in get_dataclass_fields(type(o))
-                if (field.init or field.metadata.get("force_json", False)) and not field.metadata.get("nosave", False)
-            )
-            if value is not None or field.default == dataclasses.MISSING
-        }
-    if isinstance(o, enum.Enum):
-        return o.value
-    if isinstance(o, Set):
-        return list(o)
+__encode_fields_cache: Dict[Type[Any], Tuple[Tuple[str, str, bool], ...]] = {}
+
 
+def _get_encode_fields(t: Type[Any]) -> Tuple[Tuple[str, str, bool], ...]:
+    fields = __encode_fields_cache.get(t)
+    if fields is None:
+        fields = __encode_fields_cache[t] = tuple(
+            (field.name, encode_case_for_field_name(t, field), field.default is dataclasses.MISSING)
+            for field in get_dataclass_fields(t)
+            if (field.init or field.metadata.get("force_json", False)) and not field.metadata.get("nosave", False)
+        )
+    return fields
+
+
+def __create_dataclass_encoder(t: Type[Any]) -> Callable[[Any], Any]:
+    fields = _get_encode_fields(t)
+
+    if not fields:
+        return lambda _o: {}
+
+    if len(fields) == 1:
+        attr_name, name, keep_none = fields[0]
+
+        if keep_none:
+            return lambda o: {name: getattr(o, attr_name)}
+
+        def encode_single_field(o: Any) -> Any:
+            value = getattr(o, attr_name)
+            return {name: value} if value is not None else {}
+
+        return encode_single_field
+
+    if all(keep_none for _, _, keep_none in fields):
+        names = tuple(name for _, name, _ in fields)
+        get_values = operator.attrgetter(*(attr_name for attr_name, _, _ in fields))
+        return lambda o: dict(zip(names, get_values(o)))
+
+    return lambda o: {
+        name: value
+        for attr_name, name, keep_none in fields
+        if (value := getattr(o, attr_name)) is not None or keep_none
+    }
+
+
+def __raise_no_default(o: Any) -> Any:
     raise TypeError(f"Cant' get default value for {type(o)} with value {o!r}")
 
 
+def __create_default_encoder(t: Type[Any]) -> Callable[[Any], Any]:
+    if dataclasses.is_dataclass(t):
+        return __create_dataclass_encoder(t)
+    if issubclass(t, enum.Enum):
+        return lambda o: o.value
+    if issubclass(t, Set):
+        return list
+
+    return __raise_no_default
+
+
+__default_encoders_cache: Dict[Type[Any], Callable[[Any], Any]] = {}
+
+
+def _default(o: Any) -> Any:
+    t = type(o)
+    encoder = __default_encoders_cache.get(t)
+    if encoder is None:
+        encoder = __default_encoders_cache[t] = __create_default_encoder(t)
+    return encoder(o)
+
+
+__json_encoders_cache: Dict[Tuple[bool, bool], json.JSONEncoder] = {}
+
+
+def _get_json_encoder(indent: bool, compact: bool) -> json.JSONEncoder:
+    encoder = __json_encoders_cache.get((indent, compact))
+    if encoder is None:
+        encoder = __json_encoders_cache[(indent, compact)] = json.JSONEncoder(
+            default=_default,
+            indent=4 if indent else None,
+            separators=(",", ":") if compact else None,
+        )
+    return encoder
+
+
 def as_json(obj: Any, indent: Optional[bool] = None, compact: Optional[bool] = None) -> str:
-    return json.dumps(
-        obj,
-        default=_default,
-        indent=4 if indent else None,
-        separators=(",", ":") if compact else None,
-    )
+    return _get_json_encoder(bool(indent), bool(compact)).encode(obj)
 
 
 class NamedTypeError(TypeError):
@@ -287,10 +333,22 @@ def __from_dict_handle_union(value: Any, t: Type[Any], strict: bool) -> Tuple[An
     return from_dict(value, _get_args_cached(t), strict=strict), True
 
 
+__literal_values_cache: Dict[Type[Any], FrozenSet[Any]] = {}
+
+
+def __get_literal_values_cached(t: Type[Any]) -> FrozenSet[Any]:
+    r = __literal_values_cache.get(t)
+    if r is None:
+        r = __literal_values_cache[t] = frozenset(_get_args_cached(t))
+    return r
+
+
 def __from_dict_handle_literal(value: Any, t: Type[Any], strict: bool) -> Tuple[Any, bool]:
-    args = _get_args_cached(t)
-    if value in args:
-        return value, True
+    try:
+        if value in __get_literal_values_cached(t):
+            return value, True
+    except TypeError:
+        pass
 
     return None, False
 
@@ -301,9 +359,16 @@ def __is_enum(t: Type[Any]) -> bool:
 
 
 def __from_dict_handle_enum(value: Any, t: Type[Any], strict: bool) -> Tuple[Any, bool]:
-    for v in cast(Iterable[Any], t):
-        if v.value == value:
-            return v, True
+    try:
+        member = t._value2member_map_.get(value)
+    except TypeError:
+        for v in cast(Iterable[Any], t):
+            if v.value == value:
+                return v, True
+        return None, False
+
+    if member is not None:
+        return member, True
     return None, False
 
 
@@ -313,9 +378,14 @@ def __from_dict_handle_basic_types(value: Any, t: Type[Any], strict: bool) -> Tu
     return None, False
 
 
+__ANY_ARGS = (Any,)
+
+
 def __from_dict_handle_sequence(value: Any, t: Type[Any], strict: bool) -> Tuple[Any, bool]:
     if isinstance(value, Sequence):
         args = _get_args_cached(t)
+        if args == __ANY_ARGS:
+            return (_get_origin_cached(t) or t)(value), True
         return (_get_origin_cached(t) or t)(from_dict(v, args, strict=strict) for v in value), True
     return None, False
 
@@ -323,6 +393,8 @@ def __from_dict_handle_sequence(value: Any, t: Type[Any], strict: bool) -> Tuple
 def __from_dict_handle_mapping(value: Any, t: Type[Any], strict: bool) -> Tuple[Any, bool]:
     if isinstance(value, Mapping):
         args = _get_args_cached(t)
+        if args and args[1] is Any:
+            return dict(value), True
         return {n: _from_dict_with_name(n, v, args[1] if args else None, strict=strict) for n, v in value.items()}, True
     return None, False
 
@@ -360,7 +432,7 @@ def __get_non_default_parameter(t: Type[Any], signature: inspect.Signature) -> S
     r = __non_default_parameters_cache.get(t)
     if r is None:
         r = __non_default_parameters_cache[t] = {
-            k for k, v in signature.parameters.items() if v.default == inspect.Parameter.empty
+            k for k, v in signature.parameters.items() if v.default is inspect.Parameter.empty
         }
     return r
 
@@ -375,6 +447,124 @@ def __get_signature_keys_cached(t: Type[Any], signature: inspect.Signature) -> S
     return r
 
 
+__mapping_decode_info_cache: Dict[Type[Any], Optional[Tuple[Dict[str, Any], Set[str], Set[str]]]] = {}
+
+
+def __get_mapping_decode_info(t: Type[Any]) -> Optional[Tuple[Dict[str, Any], Set[str], Set[str]]]:
+    r = __mapping_decode_info_cache.get(t, __NOT_SET)
+    if r is __NOT_SET:
+        r = None
+        origin = _get_origin_cached(t)
+        if origin is not Literal:
+            type_hints = _get_type_hints_cached(origin or t)
+            try:
+                signature = _get_signature_cached(origin or t)
+            except ValueError:
+                pass
+            else:
+                r = (
+                    type_hints,
+                    __get_non_default_parameter(origin or t, signature),
+                    __get_signature_keys_cached(origin or t, signature),
+                )
+
+        __mapping_decode_info_cache[t] = r
+
+    return cast("Optional[Tuple[Dict[str, Any], Set[str], Set[str]]]", r)
+
+
+def __get_from_dict_handler(t: Type[Any]) -> Optional[Callable[[Any, Type[Any], bool], Tuple[Any, bool]]]:
+    func = __from_dict_handlers_cache.get(t, __NOT_SET)
+    if func is __NOT_SET:
+        func = None
+        for h in __from_dict_handlers:
+            if h[0](t):
+                func = h[1]
+                break
+
+        __from_dict_handlers_cache[t] = func
+
+    return cast("Optional[Callable[[Any, Type[Any], bool], Tuple[Any, bool]]]", func)
+
+
+__simple_value_types_cache: Dict[Tuple[Type[Any], ...], Optional[FrozenSet[Type[Any]]]] = {}
+
+
+def __get_simple_value_types(types: Tuple[Type[Any], ...]) -> Optional[FrozenSet[Type[Any]]]:
+    r = __simple_value_types_cache.get(types, __NOT_SET)
+    if r is __NOT_SET:
+        r = None
+        handlers = [__get_from_dict_handler(t) for t in types]
+        if all(h is None or h is __from_dict_handle_basic_types for h in handlers):
+            simple_types = {t for t, h in zip(types, handlers) if h is not None}
+            if int in simple_types:
+                simple_types.add(bool)
+            r = frozenset(simple_types)
+
+        __simple_value_types_cache[types] = r
+
+    return cast("Optional[FrozenSet[Type[Any]]]", r)
+
+
+def __create_record_decoder(t: Type[Any]) -> Optional[Callable[[Dict[str, Any], bool], Any]]:
+    if not dataclasses.is_dataclass(t) or not isinstance(t, type):
+        return None
+
+    try:
+        signature = _get_signature_cached(t)
+    except ValueError:
+        return None
+
+    fields = get_dataclass_fields(t)
+    if [f.name for f in fields] != list(signature.parameters.keys()) or any(
+        v.default is not inspect.Parameter.empty or v.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD
+        for v in signature.parameters.values()
+    ):
+        return None
+
+    type_hints = _get_type_hints_cached(t)
+    decode_fields: List[Tuple[str, str, Type[Any], bool]] = []
+    for f in fields:
+        field_type = type_hints.get(f.name)
+        if field_type in {int, bool, float, str}:
+            decode_fields.append((encode_case_for_field_name(t, f), f.name, field_type, False))
+        elif isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
+            decode_fields.append((encode_case_for_field_name(t, f), f.name, field_type, True))
+        else:
+            return None
+
+    count = len(decode_fields)
+
+    def decode(value: Dict[str, Any], strict: bool) -> Any:
+        if len(value) != count:
+            return __NOT_SET
+
+        args = []
+        for key, name, field_type, nested in decode_fields:
+            v = value.get(key, __NOT_SET)
+            if nested:
+                if type(v) is not dict:
+                    return __NOT_SET
+                v = _from_dict_with_name(name, v, field_type, strict=strict)
+            elif type(v) is not field_type:
+                return __NOT_SET
+            args.append(v)
+
+        return t(*args)
+
+    return decode
+
+
+__record_decoders_cache: Dict[Type[Any], Optional[Callable[[Dict[str, Any], bool], Any]]] = {}
+
+
+def __get_record_decoder(t: Type[Any]) -> Optional[Callable[[Dict[str, Any], bool], Any]]:
+    r = __record_decoders_cache.get(t, __NOT_SET)
+    if r is __NOT_SET:
+        r = __record_decoders_cache[t] = __create_record_decoder(t)
+    return cast("Optional[Callable[[Dict[str, Any], bool], Any]]", r)
+
+
 def from_dict(
     value: Any,
     types: Union[Type[_T], Tuple[Type[_T], ...], None] = None,
@@ -390,21 +580,23 @@ def from_dict(
     if not types:
         return cast(_T, value)
 
-    for t in types:
-        func = __from_dict_handlers_cache.get(t, __NOT_SET)
-        if func is __NOT_SET:
-            func = None
-            for h in __from_dict_handlers:
-                if h[0](t):
-                    func = h[1]
-                    break
+    simple_value_types = __get_simple_value_types(types)
+    if simple_value_types is not None and type(value) in simple_value_types:
+        return cast(_T, value)
 
-            __from_dict_handlers_cache[t] = func
+    if len(types) == 1 and type(value) is dict:
+        record_decoder = __get_record_decoder(types[0])
+        if record_decoder is not None:
+            r = record_decoder(value, strict)
+            if r is not __NOT_SET:
+                return cast(_T, r)
 
+    for t in types:
+        func = __get_from_dict_handler(t)
         if func is None:
             continue
 
-        r, ok = func(value, t, strict)  # type: ignore
+        r, ok = func(value, t, strict)
         if ok:
             return cast(_T, r)
 
@@ -412,29 +604,19 @@ def from_dict(
         match_: Optional[Type[_T]] = None
         match_same_keys: Optional[Set[str]] = None
         match_value: Optional[Dict[str, Any]] = None
-        match_signature: Optional[inspect.Signature] = None
         match_type_hints: Optional[Dict[str, Any]] = None
 
         for t in types:
-            origin = _get_origin_cached(t)
-
-            if origin is Literal:
-                continue
-
-            cased_value: Dict[str, Any] = {_decode_case_for_member_name(t, k): v for k, v in value.items()}
-
-            type_hints = _get_type_hints_cached(origin or t)
-            try:
-                signature = _get_signature_cached(origin or t)
-            except ValueError:
+            decode_info = __get_mapping_decode_info(t)
+            if decode_info is None:
                 continue
 
-            non_default_parameters = __get_non_default_parameter(origin or t, signature)
+            type_hints, non_default_parameters, sig_keys = decode_info
 
             if len(value) == 0 and non_default_parameters:
                 continue
 
-            sig_keys = __get_signature_keys_cached(origin or t, signature)
+            cased_value: Dict[str, Any] = {_decode_case_for_member_name(t, k): v for k, v in value.items()}
 
             same_keys = cased_value.keys() & sig_keys
 
@@ -448,7 +630,6 @@ def from_dict(
                 match_same_keys = same_keys
                 match_ = t
                 match_value = cased_value
-                match_signature = signature
                 match_type_hints = type_hints
             elif match_same_keys is not None and len(match_same_keys) == len(same_keys):
                 raise TypeError(
@@ -456,12 +637,7 @@ def from_dict(
                     f"{repr(types[0].__name__) if len(types) == 1 else ' | '.join(repr(e.__name__) for e in types)}."
                 )
 
-        if (
-            match_ is not None
-            and match_value is not None
-            and match_signature is not None
-            and match_type_hints is not None
-        ):
+        if match_ is not None and match_value is not None and match_type_hints is not None:
             params: Dict[str, Any] = {
                 k: _from_dict_with_name(k, v, match_type_hints[k], strict=strict)
                 for k, v in match_value.items()
@@ -512,19 +688,25 @@ def _handle_basic_types(value: Any, _remove_defaults: bool, _encode: bool) -> An
     return value
 
 
-def _handle_dataclass(value: Any, remove_defaults: bool, encode: bool) -> Dict[str, Any]:
-    t = type(value)
-    fields = __dataclasses_cache.get(t)
+__as_dict_fields_cache: Dict[Type[Any], Tuple[Tuple[str, str, Any], ...]] = {}
+
+
+def _get_as_dict_fields(t: Type[Any]) -> Tuple[Tuple[str, str, Any], ...]:
+    fields = __as_dict_fields_cache.get(t)
     if fields is None:
-        fields = dataclasses.fields(t)
-        __dataclasses_cache[t] = fields
-    return {
-        encode_case_for_field_name(t, f) if encode else f.name: _as_dict_inner(
-            getattr(value, f.name), remove_defaults, encode
+        fields = __as_dict_fields_cache[t] = tuple(
+            (f.name, encode_case_for_field_name(t, f), f.default) for f in get_dataclass_fields(t)
         )
-        for f in fields
-        if not remove_defaults or getattr(value, f.name) != f.default
-    }
+    return fields
+
+
+def _handle_dataclass(value: Any, remove_defaults: bool, encode: bool) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for name, encoded_name, default in _get_as_dict_fields(type(value)):
+        v = getattr(value, name)
+        if not remove_defaults or default is dataclasses.MISSING or v != default:
+            result[encoded_name if encode else name] = _as_dict_inner(v, remove_defaults, encode)
+    return result
 
 
 def _as_dict_handle_named_tuple(value: Any, remove_defaults: bool, encode: bool) -> List[Any]:
@@ -693,18 +875,30 @@ def validate_types(expected_types: Union[type, Tuple[type, ...], None], value: A
     return [f"Expected type {types_str} but got {type(value)}"]
 
 
+__converters_cache: Dict[Type[Any], Tuple[Tuple[str, Callable[..., Any], bool], ...]] = {}
+
+
+def _get_field_converters(t: Type[Any]) -> Tuple[Tuple[str, Callable[..., Any], bool], ...]:
+    converters = __converters_cache.get(t)
+    if converters is None:
+        converters = __converters_cache[t] = tuple(
+            (f.name, converter, inspect.ismethod(converter))
+            for f in get_dataclass_fields(t)
+            if (converter := f.metadata.get("convert")) is not None
+        )
+    return converters
+
+
 class ValidateMixin:
     def _convert(self) -> None:
         if not dataclasses.is_dataclass(self):
             return
 
-        for f in dataclasses.fields(self):
-            converter = f.metadata.get("convert")
-            if converter is not None:
-                if inspect.ismethod(converter):
-                    setattr(self, f.name, converter(getattr(self, f.name)))
-                else:
-                    setattr(self, f.name, converter(self, getattr(self, f.name)))
+        for name, converter, is_method in _get_field_converters(type(self)):
+            if is_method:
+                setattr(self, name, converter(getattr(self, name)))
+            else:
+                setattr(self, name, converter(self, getattr(self, name)))
 
     def _validate(self) -> None:
         if not dataclasses.is_dataclass(self):
@@ -1,35 +1,32 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from robotcode.core.utils.dataclasses import to_camel_case, to_snake_case
+from robotcode.core.utils.dataclasses import CamelSnakeMixin
 
 
 @dataclass
-class Model:
-    @classmethod
-    def _encode_case(cls, s: str) -> str:
-        return to_camel_case(s)
+class Model(CamelSnakeMixin):
+    pass
 
-    @classmethod
-    def _decode_case(cls, s: str) -> str:
-        return to_snake_case(s)
 
+_next_id_iterator = itertools.count()
 
-def __next_id_iter() -> Iterator[int]:
-    i = 0
-    while True:
-        yield i
-        i += 1
 
+def _next_id() -> int:
+    return next(_next_id_iterator)
 
-_next_id_iterator = __next_id_iter()
 
+class _StrEnum(str, Enum):
+    # like enum.StrEnum from Python 3.11, str() and format() give the value on every Python version
+    def __str__(self) -> str:
+        return str.__str__(self)
 
-def _next_id() -> int:
-    return next(_next_id_iterator)
+    def __format__(self, format_spec: str) -> str:
+        return str.__format__(self, format_spec)
 
 
 @dataclass
@@ -131,7 +128,7 @@ class InitializedEvent(Event):
     event: str = "initialized"
 
 
-class StoppedReason(Enum):
+class StoppedReason(_StrEnum):
     STEP = "step"
     BREAKPOINT = "breakpoint"
     EXCEPTION = "exception"
@@ -142,9 +139,6 @@ class StoppedReason(Enum):
     DATA_BREAKPOINT = "data breakpoint"
     INSTRUCTION_BREAKPOINT = "instruction breakpoint"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class StoppedEventBody(Model):
@@ -207,25 +201,17 @@ class TerminatedEventBody(Model):
 
 
 @dataclass
-class _TerminatedEvent:
-    body: Optional[TerminatedEventBody] = None
-
-
-@dataclass
-class TerminatedEvent(Event, _TerminatedEvent):
+class TerminatedEvent(Event):
     body: Optional[TerminatedEventBody] = None
     event: str = "terminated"
 
 
-class ChecksumAlgorithm(Enum):
+class ChecksumAlgorithm(_StrEnum):
     MD5 = "MD5"
     SHA1 = "SHA1"
     SHA256 = "SHA256"
     TIMESTAMP = "timestamp"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class Checksum(Model):
@@ -245,25 +231,19 @@ class Source(Model):
     checksums: Optional[List[Checksum]] = None
 
 
-class OutputCategory(Enum):
+class OutputCategory(_StrEnum):
     CONSOLE = "console"
     IMPORTANT = "important"
     STDOUT = "stdout"
     STDERR = "stderr"
     TELEMETRY = "telemetry"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
 
-
-class OutputGroup(Enum):
+class OutputGroup(_StrEnum):
     START = "start"
     STARTCOLLAPSED = "startCollapsed"
     END = "end"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class OutputEventBody(Model):
@@ -278,12 +258,7 @@ class OutputEventBody(Model):
 
 
 @dataclass
-class _OutputEvent:
-    body: Optional[OutputEventBody] = None
-
-
-@dataclass
-class OutputEvent(Event, _OutputEvent):
+class OutputEvent(Event):
     body: Optional[OutputEventBody] = None
     event: str = "output"
 
@@ -424,13 +399,10 @@ class LaunchResponse(Response):
     pass
 
 
-class RunInTerminalKind(Enum):
+class RunInTerminalKind(_StrEnum):
     INTEGRATED = "integrated"
     EXTERNAL = "external"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class RunInTerminalRequestArguments(Model):
@@ -475,12 +447,7 @@ class ConfigurationDoneArguments(Model):
 
 
 @dataclass
-class _ConfigurationDoneRequest:
-    arguments: Optional[ConfigurationDoneArguments] = None
-
-
-@dataclass
-class ConfigurationDoneRequest(Request, _ConfigurationDoneRequest):
+class ConfigurationDoneRequest(Request):
     arguments: Optional[ConfigurationDoneArguments] = None
     command: str = "configurationDone"
 
@@ -498,12 +465,7 @@ class DisconnectArguments(Model):
 
 
 @dataclass
-class _DisconnectRequest:
-    arguments: Optional[DisconnectArguments] = None
-
-
-@dataclass
-class DisconnectRequest(Request, _DisconnectRequest):
+class DisconnectRequest(Request):
     arguments: Optional[DisconnectArguments] = None
     command: str = "disconnect"
 
@@ -602,12 +564,7 @@ class TerminateArguments(Model):
 
 
 @dataclass
-class _TerminateRequest:
-    arguments: Optional[TerminateArguments] = None
-
-
-@dataclass
-class TerminateRequest(Request, _TerminateRequest):
+class TerminateRequest(Request):
     arguments: Optional[TerminateArguments] = None
     command: str = "terminate"
 
@@ -776,15 +733,11 @@ class PauseResponse(Response):
     pass
 
 
-@dataclass
-class SteppingGranularity(Enum):
+class SteppingGranularity(_StrEnum):
     STATEMENT = "statement"
     LINE = "line"
     INSTRUCTION = "instruction"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class NextArguments(Model):
@@ -951,15 +904,12 @@ class VariablesResponse(Response, _VariablesResponse):
     body: VariablesResponseBody = field()
 
 
-class EvaluateArgumentContext(Enum):
+class EvaluateArgumentContext(_StrEnum):
     WATCH = "watch"
     REPL = "repl"
     HOVER = "hover"
     CLIPBOARD = "clipboard"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class EvaluateArguments(Model):
@@ -1045,15 +995,12 @@ class ExceptionFilterOptions(Model):
     condition: Optional[str] = None
 
 
-class ExceptionBreakMode(Enum):
+class ExceptionBreakMode(_StrEnum):
     NEVER = "never"
     ALWAYS = "always"
     UNHANDLED = "unhandled"
     USER_UNHANDLED = "userUnhandled"
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return super().__str__()
-
 
 @dataclass
 class ExceptionPathSegment(Model):
@@ -1114,7 +1061,7 @@ class CompletionsArguments(Model):
     frame_id: Optional[int] = None
 
 
-class CompletionItemType(Enum):
+class CompletionItemType(_StrEnum):
     METHOD = "method"
     FUNCTION = "function"
     CONSTRUCTOR = "constructor"
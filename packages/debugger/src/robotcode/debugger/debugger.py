@@ -89,12 +89,11 @@ else:
 
 
 class Undefined:
-    def __str__(self) -> str:
-        return self.__repr__()
-
     def __repr__(self) -> str:
         return "<undefined>"
 
+    __str__ = __repr__
+
 
 UNDEFINED = Undefined()
 
@@ -154,7 +153,34 @@ class InvalidThreadIdError(Exception):
         super().__init__(f"Invalid thread id {thread_id}")
 
 
+# shared by all entries without child frames, never append to it directly, use StackFrameEntry.add_stack_frame
+_NO_STACK_FRAMES: Deque[StackFrameEntry] = deque(maxlen=0)
+
+
 class StackFrameEntry:
+    __slots__ = (
+        "__weakref__",
+        "_global_marker",
+        "_local_marker",
+        "_suite_marker",
+        "_test_marker",
+        "column",
+        "context",
+        "handler",
+        "is_file",
+        "kwname",
+        "libname",
+        "line",
+        "longname",
+        "name",
+        "parent",
+        "source",
+        "stack_frames",
+        "top_hidden",
+        "type",
+        "variables",
+    )
+
     def __init__(
         self,
         parent: Optional[StackFrameEntry],
@@ -188,11 +214,16 @@ class StackFrameEntry:
         self._test_marker = object()
         self._local_marker = object()
         self._global_marker = object()
-        self.stack_frames: Deque[StackFrameEntry] = deque()
+        self.stack_frames: Deque[StackFrameEntry] = _NO_STACK_FRAMES
 
     def __repr__(self) -> str:
         return f"StackFrameEntry({self.name!r}, {self.type!r}, {self.source!r}, {self.line!r}, {self.column!r})"
 
+    def add_stack_frame(self, entry: StackFrameEntry) -> None:
+        if self.stack_frames is _NO_STACK_FRAMES:
+            self.stack_frames = deque()
+        self.stack_frames.appendleft(entry)
+
     def get_first_or_self(self) -> StackFrameEntry:
         if self.stack_frames:
             return self.stack_frames[0]
@@ -833,11 +864,11 @@ class Debugger:
         elif type in ["KEYWORD", "SETUP", "TEARDOWN"] and isinstance(handler, UserKeywordHandler):
             result.top_hidden = True
             if self.stack_frames:
-                self.stack_frames[0].stack_frames.appendleft(result)
+                self.stack_frames[0].add_stack_frame(result)
             self.stack_frames.appendleft(result)
         else:
             if self.stack_frames:
-                self.stack_frames[0].stack_frames.appendleft(result)
+                self.stack_frames[0].add_stack_frame(result)
 
         return result
 
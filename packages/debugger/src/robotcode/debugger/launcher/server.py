@@ -11,7 +11,6 @@ from robotcode.core.types import ServerMode, TcpParams
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.jsonrpc2.protocol import rpc_method
 from robotcode.jsonrpc2.server import JsonRPCServer
-from robotcode.robot.utils import get_robot_version
 
 from ..cli import DEBUGGER_DEFAULT_PORT, DEBUGPY_DEFAULT_PORT
 from ..dap_types import (
@@ -174,6 +173,7 @@ class LauncherDebugAdapterProtocol(DebugAdapterProtocol):
         **_kwargs: Any,
     ) -> None:
         from robotcode.core.utils.net import find_free_port
+        from robotcode.robot.utils import get_robot_version
 
         connect_timeout = launcherTimeout or 10
 
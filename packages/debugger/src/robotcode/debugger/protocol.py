@@ -72,6 +72,12 @@ class DebugAdapterRPCErrorException(JsonRPCException):
 
 TResult = TypeVar("TResult", bound=Any)
 
+_MESSAGE_TYPES: Dict[Any, Type[ProtocolMessage]] = {
+    "request": Request,
+    "response": Response,
+    "event": Event,
+}
+
 
 class DebugAdapterProtocol(JsonRPCProtocolBase):
     _logger = LoggingDescriptor()
@@ -118,6 +124,12 @@ class DebugAdapterProtocol(JsonRPCProtocolBase):
         data: Union[Dict[Any, Any], List[Dict[Any, Any]]],
     ) -> Iterator[ProtocolMessage]:
         def inner(d: Dict[Any, Any]) -> ProtocolMessage:
+            message_type = _MESSAGE_TYPES.get(d.get("type"))
+            if message_type is not None:
+                if message_type is Response and not d.get("success"):
+                    message_type = ErrorResponse
+                return from_dict(d, message_type)
+
             result = from_dict(d, (Request, Response, Event))
             if isinstance(result, Response) and not result.success:
                 return from_dict(d, ErrorResponse)
@@ -472,6 +472,13 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                     raise InvalidProtocolVersionError("Invalid JSON-RPC2 protocol version.")
                 d.pop("jsonrpc")
 
+                if "method" in d:
+                    return from_dict(d, JsonRPCRequest if "id" in d else JsonRPCNotification)
+                if "error" in d:
+                    return from_dict(d, JsonRPCError)
+                if "result" in d:
+                    return from_dict(d, JsonRPCResponse)
+
                 return from_dict(
                     d,
                     (
@@ -626,7 +626,9 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 if data.entries and send_diagnostics:
                     self.publish_diagnostics(
                         document,
-                        diagnostics=[l for l in itertools.chain(*[i for i in data.entries.values() if i is not None])],
+                        diagnostics=list(
+                            itertools.chain.from_iterable(i for i in data.entries.values() if i is not None)
+                        ),
                     )
 
         except CancelledError:
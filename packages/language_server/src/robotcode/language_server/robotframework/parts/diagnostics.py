@@ -207,13 +207,15 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
 
         result: List[Diagnostic] = []
         try:
+            ignored_lines = Namespace.get_ignored_lines(document)
+
             for token in self.parent.documents_cache.get_tokens(document):
                 check_current_task_canceled()
 
                 if token.type in [
                     Token.ERROR,
                     Token.FATAL_ERROR,
-                ] and not Namespace.should_ignore(document, range_from_token(token)):
+                ] and not Namespace.should_ignore_lines(ignored_lines, range_from_token(token)):
                     result.append(self._create_error_from_token(token))
 
                 try:
@@ -224,14 +226,15 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
                         if variable_token.type in [
                             Token.ERROR,
                             Token.FATAL_ERROR,
-                        ] and not Namespace.should_ignore(document, range_from_token(variable_token)):
+                        ] and not Namespace.should_ignore_lines(ignored_lines, range_from_token(variable_token)):
                             result.append(self._create_error_from_token(variable_token))
 
                 except VariableError as e:
-                    if not Namespace.should_ignore(document, range_from_token(token)):
+                    token_range = range_from_token(token)
+                    if not Namespace.should_ignore_lines(ignored_lines, token_range):
                         result.append(
                             Diagnostic(
-                                range=range_from_token(token),
+                                range=token_range,
                                 message=str(e),
                                 severity=DiagnosticSeverity.ERROR,
                                 source=self.source_name,
@@ -273,18 +276,19 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
         try:
             model = self.parent.documents_cache.get_model(document, True)
 
+            ignored_lines = Namespace.get_ignored_lines(document)
+
             result: List[Diagnostic] = []
             for node in iter_nodes(model):
                 check_current_task_canceled()
 
                 error = node.error if isinstance(node, HasError) else None
-                if error is not None and not Namespace.should_ignore(document, range_from_node(node)):
+                if error is not None and not Namespace.should_ignore_lines(ignored_lines, range_from_node(node)):
                     result.append(self._create_error_from_node(node, error))
                 errors = node.errors if isinstance(node, HasErrors) else None
-                if errors is not None:
+                if errors and not Namespace.should_ignore_lines(ignored_lines, range_from_node(node)):
                     for e in errors:
-                        if not Namespace.should_ignore(document, range_from_node(node)):
-                            result.append(self._create_error_from_node(node, e))
+                        result.append(self._create_error_from_node(node, e))
 
             return DiagnosticsResult(self.collect_model_errors, result)
 
@@ -328,13 +332,14 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
     def _collect_unused_keyword_references(self, document: TextDocument) -> DiagnosticsResult:
         try:
             namespace = self.parent.documents_cache.get_namespace(document)
+            ignored_lines = Namespace.get_ignored_lines(document)
 
             result: List[Diagnostic] = []
             for kw in (namespace.get_library_doc()).keywords.values():
                 check_current_task_canceled()
 
                 references = self.parent.robot_references.find_keyword_references(document, kw, False, True)
-                if not references and not Namespace.should_ignore(document, kw.name_range):
+                if not references and not Namespace.should_ignore_lines(ignored_lines, kw.name_range):
                     result.append(
                         Diagnostic(
                             range=kw.name_range,
@@ -387,6 +392,7 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
     def _collect_unused_variable_references(self, document: TextDocument) -> DiagnosticsResult:
         try:
             namespace = self.parent.documents_cache.get_namespace(document)
+            ignored_lines = Namespace.get_ignored_lines(document)
 
             result: List[Diagnostic] = []
 
@@ -399,7 +405,7 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
                     continue
 
                 references = self.parent.robot_references.find_variable_references(document, var, False, True)
-                if not references and not Namespace.should_ignore(document, var.name_range):
+                if not references and not Namespace.should_ignore_lines(ignored_lines, var.name_range):
                     result.append(
                         Diagnostic(
                             range=var.name_range,
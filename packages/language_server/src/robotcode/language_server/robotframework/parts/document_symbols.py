@@ -1,6 +1,6 @@
 import ast
 import itertools
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Set, Union
 
 from robot.errors import VariableError
 from robot.parsing.lexer.tokens import Token
@@ -52,14 +52,27 @@ class _Visitor(Visitor):
 
         self.result: List[DocumentSymbol] = []
         self.current_symbol: Optional[DocumentSymbol] = None
+        self.current_child_names: Set[str] = set()
 
     def generic_visit_current_symbol(self, node: ast.AST, symbol: DocumentSymbol) -> None:
         old = self.current_symbol
+        old_child_names = self.current_child_names
         self.current_symbol = symbol
+        self.current_child_names = set()
         try:
             self.generic_visit(node)
         finally:
             self.current_symbol = old
+            self.current_child_names = old_child_names
+
+    def append_child(self, symbol: DocumentSymbol) -> None:
+        if self.current_symbol is not None and self.current_symbol.children is not None:
+            self.current_symbol.children.append(symbol)
+            self.current_child_names.add(symbol.name)
+
+    def append_unique_child(self, symbol: DocumentSymbol) -> None:
+        if symbol.name not in self.current_child_names:
+            self.append_child(symbol)
 
     @classmethod
     def find_from(cls, model: ast.AST, parent: RobotDocumentSymbolsProtocolPart) -> Optional[List[DocumentSymbol]]:
@@ -99,7 +112,7 @@ class _Visitor(Visitor):
                 selection_range=r,
                 children=[],
             )
-            self.current_symbol.children.append(symbol)
+            self.append_child(symbol)
 
             self.generic_visit_current_symbol(node, symbol)
 
@@ -116,7 +129,7 @@ class _Visitor(Visitor):
                 selection_range=r,
                 children=[],
             )
-            self.current_symbol.children.append(symbol)
+            self.append_child(symbol)
 
             self.generic_visit_current_symbol(node, symbol)
 
@@ -139,8 +152,7 @@ class _Visitor(Visitor):
                         range=r,
                         selection_range=r,
                     )
-                    if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                        self.current_symbol.children.append(symbol)
+                    self.append_unique_child(symbol)
 
     def get_variable_token(self, token: Token) -> Optional[Token]:
         return next(
@@ -175,8 +187,7 @@ class _Visitor(Visitor):
                             range=r,
                             selection_range=r,
                         )
-                        if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                            self.current_symbol.children.append(symbol)
+                        self.append_unique_child(symbol)
 
                 except VariableError:
                     pass
@@ -195,8 +206,7 @@ class _Visitor(Visitor):
                         range=r,
                         selection_range=r,
                     )
-                    if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                        self.current_symbol.children.append(symbol)
+                    self.append_unique_child(symbol)
 
     def visit_ExceptHeader(self, node: Statement) -> None:  # noqa: N802
         variables = node.get_tokens(Token.VARIABLE)
@@ -212,8 +222,7 @@ class _Visitor(Visitor):
                         range=r,
                         selection_range=r,
                     )
-                    if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                        self.current_symbol.children.append(symbol)
+                    self.append_unique_child(symbol)
 
     def visit_Var(self, node: Statement) -> None:  # noqa: N802
         variables = node.get_tokens(Token.VARIABLE)
@@ -229,8 +238,7 @@ class _Visitor(Visitor):
                         range=r,
                         selection_range=r,
                     )
-                    if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                        self.current_symbol.children.append(symbol)
+                    self.append_unique_child(symbol)
 
     def visit_KeywordName(self, node: Statement) -> None:  # noqa: N802
         name_token = node.get_token(Token.KEYWORD_NAME)
@@ -251,8 +259,7 @@ class _Visitor(Visitor):
                         range=r,
                         selection_range=r,
                     )
-                    if symbol.name not in map(lambda v: v.name, self.current_symbol.children):
-                        self.current_symbol.children.append(symbol)
+                    self.append_unique_child(symbol)
 
     def visit_Variable(self, node: Statement) -> None:  # noqa: N802
         name_token = node.get_token(Token.VARIABLE)
@@ -269,4 +276,4 @@ class _Visitor(Visitor):
         if self.current_symbol is not None and self.current_symbol.children is not None:
             r = range_from_node(node)
             symbol = DocumentSymbol(name=name, kind=SymbolKind.VARIABLE, range=r, selection_range=r)
-            self.current_symbol.children.append(symbol)
+            self.append_child(symbol)
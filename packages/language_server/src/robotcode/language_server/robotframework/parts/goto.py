@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
+import functools
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from robotcode.core.concurrent import check_current_task_canceled
 from robotcode.core.language import language_id
@@ -8,6 +9,7 @@ from robotcode.core.lsp.types import Location, LocationLink, Position, Range
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.robot.diagnostics.namespace import Namespace
 from robotcode.robot.utils.ast import range_from_token
 
 from .protocol_part import RobotLanguageServerProtocolPart
@@ -16,14 +18,53 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
+@functools.lru_cache(maxsize=4096)
+def _uri_str(path: str) -> str:
+    return str(Uri.from_path(path))
+
+
+def _location_link(
+    origin_selection_range: Range,
+    source: str,
+    target_range: Range,
+    target_selection_range: Optional[Range] = None,
+) -> LocationLink:
+    return LocationLink(
+        origin_selection_range=origin_selection_range,
+        target_uri=_uri_str(source),
+        target_range=target_range,
+        target_selection_range=target_selection_range if target_selection_range is not None else target_range,
+    )
+
+
+def _copy_location_links(links: Optional[List[LocationLink]]) -> Optional[List[LocationLink]]:
+    if links is None:
+        return None
+
+    # the ranges are replaced, never modified, by the utf16 conversion of the caller
+    return [
+        LocationLink(
+            origin_selection_range=link.origin_selection_range,
+            target_uri=link.target_uri,
+            target_range=link.target_range,
+            target_selection_range=link.target_selection_range,
+        )
+        for link in links
+    ]
+
+
 class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
     def __init__(self, parent: RobotLanguageServerProtocol) -> None:
         super().__init__(parent)
 
+        self._last_result: Optional[Tuple[Namespace, int, int, Optional[List[LocationLink]]]] = None
+
         parent.definition.collect.add(self.collect_definition)
         parent.implementation.collect.add(self.collect_implementation)
+        parent.documents.did_change.add(self.document_did_change)
+        parent.documents.on_document_cache_invalidated.add(self.document_did_change)
 
     @language_id("robotframework")
     @_logger.call
@@ -39,11 +80,32 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
     ) -> Union[Location, List[Location], List[LocationLink], None]:
         return self.collect(document, position)
 
+    @language_id("robotframework")
+    def document_did_change(self, sender: Any, document: TextDocument) -> None:
+        self._last_result = None
+
     def collect(
         self, document: TextDocument, position: Position
     ) -> Union[Location, List[Location], List[LocationLink], None]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
+        last_result = self._last_result
+        if (
+            last_result is not None
+            and last_result[0] is namespace
+            and last_result[1] == position.line
+            and last_result[2] == position.character
+        ):
+            return _copy_location_links(last_result[3])
+
+        # the caller replaces the ranges of the returned links, so keep our own links
+        result = self._collect(namespace, document, position)
+        self._last_result = (namespace, position.line, position.character, _copy_location_links(result))
+        return result
+
+    def _collect(
+        self, namespace: Namespace, document: TextDocument, position: Position
+    ) -> Optional[List[LocationLink]]:
         all_variable_refs = namespace.get_variable_references()
 
         if all_variable_refs:
@@ -55,24 +117,19 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
                 found_range = (
                     variable.name_range
                     if variable.source == namespace.source and position.is_in_range(variable.name_range, False)
-                    else cast(
-                        Optional[Range],
-                        next(
-                            (r.range for r in var_refs if position.is_in_range(r.range)),
-                            None,
-                        ),
+                    else next(
+                        (r.range for r in var_refs if position.is_in_range(r.range)),
+                        None,
                     )
                 )
 
                 if found_range is not None and variable.source:
                     result.append(
-                        LocationLink(
-                            origin_selection_range=found_range,
-                            target_uri=str(Uri.from_path(variable.source)),
-                            target_range=variable.range,
-                            target_selection_range=(
-                                range_from_token(variable.name_token) if variable.name_token else variable.range
-                            ),
+                        _location_link(
+                            found_range,
+                            variable.source,
+                            variable.range,
+                            range_from_token(variable.name_token) if variable.name_token else None,
                         )
                     )
 
@@ -89,24 +146,14 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
                 found_range = (
                     kw.name_range
                     if kw.source == namespace.source and position.is_in_range(kw.name_range, False)
-                    else cast(
-                        Optional[Range],
-                        next(
-                            (r.range for r in kw_refs if position.is_in_range(r.range, False)),
-                            None,
-                        ),
+                    else next(
+                        (r.range for r in kw_refs if position.is_in_range(r.range, False)),
+                        None,
                     )
                 )
 
                 if found_range is not None and kw.source:
-                    result.append(
-                        LocationLink(
-                            origin_selection_range=found_range,
-                            target_uri=str(Uri.from_path(kw.source)),
-                            target_range=kw.range,
-                            target_selection_range=range_from_token(kw.name_token) if kw.name_token else kw.range,
-                        )
-                    )
+                    result.append(_location_link(found_range, kw.source, kw.range))
 
             if result:
                 return result
@@ -131,34 +178,19 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
 
                         if found_range == ns.import_range and str(document.uri.to_path()) == ns.import_source:
                             if libdoc.source:
-                                result.append(
-                                    LocationLink(
-                                        origin_selection_range=found_range,
-                                        target_uri=str(Uri.from_path(libdoc.source)),
-                                        target_range=ns.library_doc.range,
-                                        target_selection_range=ns.library_doc.range,
-                                    )
-                                )
+                                result.append(_location_link(found_range, libdoc.source, libdoc.range))
                                 return result
                         else:
                             if ns.import_source:
                                 result.append(
-                                    LocationLink(
-                                        origin_selection_range=found_range,
-                                        target_uri=str(Uri.from_path(ns.import_source)),
-                                        target_range=ns.alias_range if ns.alias_range else ns.import_range,
-                                        target_selection_range=ns.alias_range if ns.alias_range else ns.import_range,
+                                    _location_link(
+                                        found_range,
+                                        ns.import_source,
+                                        ns.alias_range if ns.alias_range else ns.import_range,
                                     )
                                 )
                             elif libdoc is not None and libdoc.source:
-                                result.append(
-                                    LocationLink(
-                                        origin_selection_range=found_range,
-                                        target_uri=str(Uri.from_path(libdoc.source)),
-                                        target_range=ns.library_doc.range,
-                                        target_selection_range=ns.library_doc.range,
-                                    )
-                                )
+                                result.append(_location_link(found_range, libdoc.source, libdoc.range))
 
             if result:
                 return result
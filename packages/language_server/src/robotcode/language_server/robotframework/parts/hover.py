@@ -8,7 +8,6 @@ from typing import (
     List,
     Optional,
     Tuple,
-    Type,
     cast,
 )
 
@@ -52,21 +51,6 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         parent.hover.collect.add(self.collect)
 
-    def _find_method(self, cls: Type[Any]) -> Optional[_HoverMethod]:
-        if cls is ast.AST:
-            return None
-        method_name = "hover_" + cls.__name__
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            if callable(method):
-                return cast(_HoverMethod, method)
-        for base in cls.__bases__:
-            method = self._find_method(base)
-            if method:
-                return cast(_HoverMethod, method)
-
-        return None
-
     @language_id("robotframework")
     @_logger.call
     def collect(self, sender: Any, document: TextDocument, position: Position) -> Optional[Hover]:
@@ -84,7 +68,7 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         for result_node in reversed(result_nodes):
             check_current_task_canceled()
 
-            method = self._find_method(type(result_node))
+            method: Optional[_HoverMethod] = self._find_node_method(type(result_node), "hover")
             if method is not None:
                 result = method(result_node, result_nodes, document, position)
                 if result is not None:
@@ -106,12 +90,9 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                 found_range = (
                     variable.name_range
                     if variable.source == namespace.source and position.is_in_range(variable.name_range, False)
-                    else cast(
-                        Optional[Range],
-                        next(
-                            (r.range for r in var_refs if position.is_in_range(r.range)),
-                            None,
-                        ),
+                    else next(
+                        (r.range for r in var_refs if position.is_in_range(r.range)),
+                        None,
                     )
                 )
 
@@ -174,12 +155,9 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                 found_range = (
                     kw.name_range
                     if kw.source == namespace.source and position.is_in_range(kw.name_range, False)
-                    else cast(
-                        Optional[Range],
-                        next(
-                            (r.range for r in kw_refs if position.is_in_range(r.range, False)),
-                            None,
-                        ),
+                    else next(
+                        (r.range for r in kw_refs if position.is_in_range(r.range, False)),
+                        None,
                     )
                 )
 
@@ -205,12 +183,9 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                     else (
                         ns.alias_range
                         if ns.import_source == namespace.source and position.is_in_range(ns.alias_range, False)
-                        else cast(
-                            Optional[Range],
-                            next(
-                                (r.range for r in ns_refs if position.is_in_range(r.range, False)),
-                                None,
-                            ),
+                        else next(
+                            (r.range for r in ns_refs if position.is_in_range(r.range, False)),
+                            None,
                         )
                     )
                 )
@@ -1,7 +1,16 @@
 import ast
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, cast
 
+from robot.errors import DataError
 from robot.parsing.lexer.tokens import Token
+from robot.parsing.model.statements import (
+    Fixture,
+    KeywordCall,
+    LibraryImport,
+    Template,
+    TestTemplate,
+    VariablesImport,
+)
 
 from robotcode.core.concurrent import check_current_task_canceled
 from robotcode.core.language import language_id
@@ -50,21 +59,6 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         return self.parent.workspace.get_configuration(InlayHintsConfig, folder.uri)
 
-    def _find_method(self, cls: Type[Any]) -> Optional[_HandlerMethod]:
-        if cls is ast.AST:
-            return None
-        method_name = "handle_" + cls.__name__
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            if callable(method):
-                return cast(_HandlerMethod, method)
-        for base in cls.__bases__:
-            method = self._find_method(base)
-            if method:
-                return cast(_HandlerMethod, method)
-
-        return None
-
     @language_id("robotframework")
     @_logger.call
     def collect(self, sender: Any, document: TextDocument, range: Range) -> Optional[List[InlayHint]]:
@@ -87,7 +81,7 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
             if node_range.start > range.end:
                 break
 
-            method = self._find_method(type(node))
+            method: Optional[_HandlerMethod] = self._find_node_method(type(node), "handle")
             if method is not None:
                 r = method(document, range, node, model, namespace, config)
                 if r is not None:
@@ -128,8 +122,6 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.errors import DataError
-
         result: List[InlayHint] = []
 
         if config.parameter_names:
@@ -227,15 +219,12 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import KeywordCall
-
         keyword_call = cast(KeywordCall, node)
-        keyword_token = keyword_call.get_token(RobotToken.KEYWORD)
+        keyword_token = keyword_call.get_token(Token.KEYWORD)
         if keyword_token is None or not keyword_token.value:
             return None
 
-        arguments = keyword_call.get_tokens(RobotToken.ARGUMENT)
+        arguments = keyword_call.get_tokens(Token.ARGUMENT)
         return self._handle_keywordcall_fixture_template(keyword_token, arguments, namespace, config)
 
     def handle_Fixture(  # noqa: N802
@@ -247,15 +236,12 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import Fixture
-
         fixture = cast(Fixture, node)
-        keyword_token = fixture.get_token(RobotToken.NAME)
+        keyword_token = fixture.get_token(Token.NAME)
         if keyword_token is None or not keyword_token.value:
             return None
 
-        arguments = fixture.get_tokens(RobotToken.ARGUMENT)
+        arguments = fixture.get_tokens(Token.ARGUMENT)
         return self._handle_keywordcall_fixture_template(keyword_token, arguments, namespace, config)
 
     def handle_TestTemplate(  # noqa: N802
@@ -267,11 +253,8 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import TestTemplate
-
         template = cast(TestTemplate, node)
-        keyword_token = template.get_token(RobotToken.NAME, RobotToken.ARGUMENT)
+        keyword_token = template.get_token(Token.NAME, Token.ARGUMENT)
         if keyword_token is None or not keyword_token.value:
             return None
 
@@ -286,11 +269,8 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import Template
-
         template = cast(Template, node)
-        keyword_token = template.get_token(RobotToken.NAME, RobotToken.ARGUMENT)
+        keyword_token = template.get_token(Token.NAME, Token.ARGUMENT)
         if keyword_token is None or not keyword_token.value:
             return None
 
@@ -305,9 +285,6 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import LibraryImport
-
         library_node = cast(LibraryImport, node)
 
         if not library_node.name:
@@ -333,7 +310,7 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
             self._logger.exception(e)
             return None
 
-        arguments = library_node.get_tokens(RobotToken.ARGUMENT)
+        arguments = library_node.get_tokens(Token.ARGUMENT)
 
         for kw_doc in lib_doc.inits:
             return self._get_inlay_hint(None, kw_doc, arguments, namespace, config)
@@ -349,9 +326,6 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         namespace: Namespace,
         config: InlayHintsConfig,
     ) -> Optional[List[InlayHint]]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import VariablesImport
-
         library_node = cast(VariablesImport, node)
 
         if not library_node.name:
@@ -377,7 +351,7 @@ class RobotInlayHintProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
             self._logger.exception(e)
             return None
 
-        arguments = library_node.get_tokens(RobotToken.ARGUMENT)
+        arguments = library_node.get_tokens(Token.ARGUMENT)
 
         for kw_doc in lib_doc.inits:
             return self._get_inlay_hint(None, kw_doc, arguments, namespace, config)
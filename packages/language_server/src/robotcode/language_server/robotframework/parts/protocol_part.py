@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import ast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
 
 from robotcode.jsonrpc2.protocol import GenericJsonRPCProtocolPart
 
@@ -8,6 +9,33 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
+_node_method_names: Dict[Tuple[Type[Any], Type[Any], str], Optional[str]] = {}
+
+
+def _find_node_method_name(part_cls: Type[Any], node_cls: Type[Any], prefix: str) -> Optional[str]:
+    key = (part_cls, node_cls, prefix)
+    if key in _node_method_names:
+        return _node_method_names[key]
+
+    result: Optional[str] = None
+    if node_cls is not ast.AST:
+        method_name = prefix + "_" + node_cls.__name__
+        if callable(getattr(part_cls, method_name, None)):
+            result = method_name
+        else:
+            for base in node_cls.__bases__:
+                result = _find_node_method_name(part_cls, base, prefix)
+                if result is not None:
+                    break
+
+    _node_method_names[key] = result
+    return result
+
+
 class RobotLanguageServerProtocolPart(GenericJsonRPCProtocolPart["RobotLanguageServerProtocol"]):
     def __init__(self, parent: RobotLanguageServerProtocol) -> None:
         super().__init__(parent)
+
+    def _find_node_method(self, node_cls: Type[Any], prefix: str) -> Optional[Callable[..., Any]]:
+        method_name = _find_node_method_name(type(self), node_cls, prefix)
+        return getattr(self, method_name) if method_name is not None else None
@@ -1,6 +1,6 @@
 import ast
 from concurrent.futures import CancelledError
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, cast
 
 from robot.parsing.model.statements import Statement
 
@@ -100,20 +100,6 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
 
         self.cache_cleared(self)
 
-    def _find_method(self, cls: Type[Any]) -> Optional[_ReferencesMethod]:
-        if cls is ast.AST:
-            return None
-        method_name = "references_" + cls.__name__
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            if callable(method):
-                return cast(_ReferencesMethod, method)
-        for base in cls.__bases__:
-            method = self._find_method(base)
-            if method:
-                return cast(_ReferencesMethod, method)
-        return None
-
     @language_id("robotframework")
     @_logger.call
     def collect(
@@ -136,7 +122,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         if result:
             return result
 
-        method = self._find_method(type(result_node))
+        method: Optional[_ReferencesMethod] = self._find_node_method(type(result_node), "references")
         if method is not None:
             result = method(result_node, document, position, context)
             if result is not None:
@@ -175,20 +161,21 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         all_variable_refs = namespace.get_variable_references()
         if all_variable_refs:
             for var, var_refs in all_variable_refs.items():
-                if var.source == namespace.source and position in var.name_range:
+                if var.source == namespace.source and position.is_in_range(var.name_range):
+                    return self.find_variable_references(document, var, context.include_declaration)
+                if any(position.is_in_range(r.range) for r in var_refs):
                     return self.find_variable_references(document, var, context.include_declaration)
-                for r in var_refs:
-                    if (var.source == namespace.source and position in var.name_range) or position in r.range:
-                        return self.find_variable_references(document, var, context.include_declaration)
 
         all_kw_refs = namespace.get_keyword_references()
         if all_kw_refs:
             for kw, kw_refs in all_kw_refs.items():
-                if kw.source == namespace.source and position in kw.name_range:
+                is_local = kw.source == namespace.source
+                if is_local and position.is_in_range(kw.name_range):
+                    return self.find_keyword_references(document, kw, context.include_declaration)
+                if kw_refs and is_local and position.is_in_range(kw.range):
+                    return self.find_keyword_references(document, kw, context.include_declaration)
+                if any(position.is_in_range(r.range) for r in kw_refs):
                     return self.find_keyword_references(document, kw, context.include_declaration)
-                for r in kw_refs:
-                    if (kw.source == namespace.source and position in kw.range) or position in r.range:
-                        return self.find_keyword_references(document, kw, context.include_declaration)
 
         return None
 
@@ -6,8 +6,6 @@ from typing import (
     List,
     Optional,
     Tuple,
-    Type,
-    TypeVar,
     Union,
     cast,
 )
@@ -53,8 +51,6 @@ if TYPE_CHECKING:
 _RenameMethod = Callable[[ast.AST, TextDocument, Position, str], Optional[WorkspaceEdit]]
 _PrepareRenameMethod = Callable[[ast.AST, TextDocument, Position], Optional[PrepareRenameResult]]
 
-_T = TypeVar("_T", bound=Callable[..., Any])
-
 
 class RobotRenameProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
     _logger = LoggingDescriptor()
@@ -65,20 +61,6 @@ class RobotRenameProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         parent.rename.collect.add(self.collect)
         parent.rename.collect_prepare.add(self.collect_prepare)
 
-    def _find_method(self, cls: Type[Any], prefix: str) -> Optional[_T]:
-        if cls is ast.AST:
-            return None
-        method_name = prefix + "_" + cls.__name__
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            if callable(method):
-                return cast(_T, method)
-        for base in cls.__bases__:
-            method = self._find_method(base, prefix)
-            if method:
-                return cast(_T, method)
-        return None
-
     @language_id("robotframework")
     @_logger.call
     def collect(
@@ -103,7 +85,7 @@ class RobotRenameProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         if result:
             return result
 
-        method: Optional[_RenameMethod] = self._find_method(type(result_node), "rename")
+        method: Optional[_RenameMethod] = self._find_node_method(type(result_node), "rename")
         if method is not None:
             result = method(result_node, document, position, new_name)
             if result is not None:
@@ -129,7 +111,7 @@ class RobotRenameProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         if result:
             return result
 
-        method: Optional[_PrepareRenameMethod] = self._find_method(type(result_node), "prepare_rename")
+        method: Optional[_PrepareRenameMethod] = self._find_node_method(type(result_node), "prepare_rename")
         if method is not None:
             result = method(result_node, document, position)
             if result is not None:
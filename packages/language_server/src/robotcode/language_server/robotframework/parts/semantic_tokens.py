@@ -153,12 +153,24 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         parent.semantic_tokens.token_types += list(RobotSemTokenTypes)
         parent.semantic_tokens.token_modifiers += list(RobotSemTokenModifiers)
 
+        self._token_legend_indexes: Optional[Tuple[Dict[Enum, int], Dict[Enum, int]]] = None
+
         parent.semantic_tokens.collect_full.add(self.collect_full)
         # parent.semantic_tokens.collect_range.add(self.collect_range)
         # parent.semantic_tokens.collect_full_delta.add(self.collect_full_delta)
 
         self.parent.on_initialized.add(self._on_initialized)
 
+    def _get_token_legend_indexes(self) -> Tuple[Dict[Enum, int], Dict[Enum, int]]:
+        # the legend is sent to the client with the server capabilities and does not change afterwards
+        if self._token_legend_indexes is None:
+            self._token_legend_indexes = (
+                {e: i for i, e in enumerate(self.parent.semantic_tokens.token_types)},
+                {e: 1 << i for i, e in enumerate(self.parent.semantic_tokens.token_modifiers)},
+            )
+
+        return self._token_legend_indexes
+
     def _on_initialized(self, sender: Any) -> None:
         self.parent.documents_cache.namespace_invalidated.add(self.namespace_invalidated)
 
@@ -1119,6 +1131,8 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
 
         lines = document.get_lines()
 
+        token_type_indexes, token_modifier_bits = self._get_token_legend_indexes()
+
         for robot_token, robot_node in takewhile(
             lambda t: range is None or token_in_range(t[0], range),
             dropwhile(
@@ -1159,13 +1173,10 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
 
                 data.append(token_length)
 
-                data.append(self.parent.semantic_tokens.token_types.index(token.sem_token_type))
+                data.append(token_type_indexes[token.sem_token_type])
 
                 data.append(
-                    reduce(
-                        operator.or_,
-                        [2 ** self.parent.semantic_tokens.token_modifiers.index(e) for e in token.sem_modifiers],
-                    )
+                    reduce(operator.or_, [token_modifier_bits[e] for e in token.sem_modifiers])
                     if token.sem_modifiers
                     else 0
                 )
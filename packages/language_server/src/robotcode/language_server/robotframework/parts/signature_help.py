@@ -7,12 +7,11 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
-    Type,
     cast,
 )
 
 from robot.parsing.lexer.tokens import Token
-from robot.parsing.model.statements import Statement
+from robot.parsing.model.statements import Fixture, LibraryImport, Statement, VariablesImport
 
 from robotcode.core.language import language_id
 from robotcode.core.lsp.types import (
@@ -57,20 +56,6 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
 
         parent.signature_help.collect.add(self.collect)
 
-    def _find_method(self, cls: Type[Any]) -> Optional[_SignatureHelpMethod]:
-        if cls is ast.AST:
-            return None
-        method_name = "signature_help_" + cls.__name__
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            if callable(method):
-                return cast(_SignatureHelpMethod, method)
-        for base in cls.__bases__:
-            method = self._find_method(base)
-            if method:
-                return cast(_SignatureHelpMethod, method)
-        return None
-
     @language_id("robotframework")
     @trigger_characters([" ", "\t"])
     @retrigger_characters([" ", "\t"])
@@ -90,7 +75,7 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         if result_node is None:
             return None
 
-        method = self._find_method(type(result_node))
+        method: Optional[_SignatureHelpMethod] = self._find_node_method(type(result_node), "signature_help")
         if method is None:
             return None
 
@@ -104,8 +89,6 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         position: Position,
         context: Optional[SignatureHelpContext] = None,
     ) -> Optional[SignatureHelp]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-
         kw_node = cast(Statement, node)
 
         tokens_at_position = get_tokens_at_position(kw_node, position, include_end=True)
@@ -116,9 +99,9 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         token_at_position = tokens_at_position[-1]
 
         if token_at_position.type not in [
-            RobotToken.ARGUMENT,
-            RobotToken.EOL,
-            RobotToken.SEPARATOR,
+            Token.ARGUMENT,
+            Token.EOL,
+            Token.SEPARATOR,
         ]:
             return None
 
@@ -133,7 +116,7 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         keyword_doc_and_token = self.get_keyworddoc_and_token_from_position(
             keyword_token.value,
             keyword_token,
-            [t for t in kw_node.get_tokens(RobotToken.ARGUMENT)],
+            [t for t in kw_node.get_tokens(Token.ARGUMENT)],
             namespace,
             range_from_token(keyword_token).start,
             analyse_run_keywords=False,
@@ -201,9 +184,7 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         position: Position,
         context: Optional[SignatureHelpContext] = None,
     ) -> Optional[SignatureHelp]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-
-        return self._signature_help_KeywordCall_or_Fixture(RobotToken.KEYWORD, node, document, position, context)
+        return self._signature_help_KeywordCall_or_Fixture(Token.KEYWORD, node, document, position, context)
 
     def signature_help_Fixture(  # noqa: N802
         self,
@@ -212,14 +193,11 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         position: Position,
         context: Optional[SignatureHelpContext] = None,
     ) -> Optional[SignatureHelp]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import Fixture
-
-        name_token = cast(Fixture, node).get_token(RobotToken.NAME)
+        name_token = cast(Fixture, node).get_token(Token.NAME)
         if name_token is None or name_token.value is None or name_token.value.upper() in ("", "NONE"):
             return None
 
-        return self._signature_help_KeywordCall_or_Fixture(RobotToken.NAME, node, document, position, context)
+        return self._signature_help_KeywordCall_or_Fixture(Token.NAME, node, document, position, context)
 
     def signature_help_LibraryImport(  # noqa: N802
         self,
@@ -228,14 +206,11 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         position: Position,
         context: Optional[SignatureHelpContext] = None,
     ) -> Optional[SignatureHelp]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import LibraryImport
-
         library_node = cast(LibraryImport, node)
 
         if (
             not library_node.name
-            or position <= range_from_token(library_node.get_token(RobotToken.NAME)).extend(end_character=1).end
+            or position <= range_from_token(library_node.get_token(Token.NAME)).extend(end_character=1).end
         ):
             return None
 
@@ -269,9 +244,9 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         token_at_position = tokens_at_position[-1]
 
         if token_at_position.type not in [
-            RobotToken.ARGUMENT,
-            RobotToken.EOL,
-            RobotToken.SEPARATOR,
+            Token.ARGUMENT,
+            Token.EOL,
+            Token.SEPARATOR,
         ]:
             return None
 
@@ -295,12 +270,9 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         position: Position,
         context: Optional[SignatureHelpContext] = None,
     ) -> Optional[SignatureHelp]:
-        from robot.parsing.lexer.tokens import Token as RobotToken
-        from robot.parsing.model.statements import VariablesImport
-
         variables_node = cast(VariablesImport, node)
 
-        name_token = variables_node.get_token(RobotToken.NAME)
+        name_token = variables_node.get_token(Token.NAME)
         if name_token is None:
             return None
 
@@ -333,9 +305,9 @@ class RobotSignatureHelpProtocolPart(RobotLanguageServerProtocolPart, ModelHelpe
         token_at_position = tokens_at_position[-1]
 
         if token_at_position.type not in [
-            RobotToken.ARGUMENT,
-            RobotToken.EOL,
-            RobotToken.SEPARATOR,
+            Token.ARGUMENT,
+            Token.EOL,
+            Token.SEPARATOR,
         ]:
             return None
 
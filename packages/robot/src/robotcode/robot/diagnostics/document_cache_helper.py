@@ -356,46 +356,36 @@ class DocumentsCacheHelper:
 
     def get_general_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         if data_only:
-            return document.get_cache(
-                self.__get_general_model_data_only,
-                self.get_general_tokens(document, True),
-            )
-        return document.get_cache(self.__get_general_model, self.get_general_tokens(document))
+            return document.get_cache(self.__get_general_model_data_only)
+        return document.get_cache(self.__get_general_model)
 
-    def __get_general_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.GENERAL)
+    def __get_general_model_data_only(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_general_tokens(document, True), DocumentType.GENERAL)
 
-    def __get_general_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.GENERAL)
+    def __get_general_model(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_general_tokens(document), DocumentType.GENERAL)
 
     def get_resource_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         if data_only:
-            return document.get_cache(
-                self.__get_resource_model_data_only,
-                self.get_resource_tokens(document, True),
-            )
+            return document.get_cache(self.__get_resource_model_data_only)
+        return document.get_cache(self.__get_resource_model)
 
-        return document.get_cache(self.__get_resource_model, self.get_resource_tokens(document))
+    def __get_resource_model_data_only(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_resource_tokens(document, True), DocumentType.RESOURCE)
 
-    def __get_resource_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.RESOURCE)
-
-    def __get_resource_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.RESOURCE)
+    def __get_resource_model(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_resource_tokens(document), DocumentType.RESOURCE)
 
     def get_init_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         if data_only:
-            return document.get_cache(
-                self.__get_init_model_data_only,
-                self.get_init_tokens(document, True),
-            )
-        return document.get_cache(self.__get_init_model, self.get_init_tokens(document))
+            return document.get_cache(self.__get_init_model_data_only)
+        return document.get_cache(self.__get_init_model)
 
-    def __get_init_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.INIT)
+    def __get_init_model_data_only(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_init_tokens(document, True), DocumentType.INIT)
 
-    def __get_init_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.INIT)
+    def __get_init_model(self, document: TextDocument) -> ast.AST:
+        return self.__get_model(document, self.get_init_tokens(document), DocumentType.INIT)
 
     def get_namespace(self, document: TextDocument) -> Namespace:
         return document.get_cache(self.__get_namespace)
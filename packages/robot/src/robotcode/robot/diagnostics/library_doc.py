@@ -20,6 +20,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -108,21 +109,23 @@ if get_robot_version() >= (7, 0):
     from robot.utils import NOT_SET as robot_notset  # type: ignore[no-redef] # noqa: N811
 
 
-RUN_KEYWORD_NAMES = [
-    "Run Keyword",
-    "Run Keyword And Continue On Failure",
-    "Run Keyword And Ignore Error",
-    "Run Keyword And Return",
-    "Run Keyword And Return Status",
-    "Run Keyword If All Critical Tests Passed",
-    "Run Keyword If All Tests Passed",
-    "Run Keyword If Any Critical Tests Failed",
-    "Run Keyword If Any Tests Failed",
-    "Run Keyword If Test Failed",
-    "Run Keyword If Test Passed",
-    "Run Keyword If Timeout Occurred",
-    "Run Keyword And Warn On Failure",
-]
+RUN_KEYWORD_NAMES: FrozenSet[str] = frozenset(
+    {
+        "Run Keyword",
+        "Run Keyword And Continue On Failure",
+        "Run Keyword And Ignore Error",
+        "Run Keyword And Return",
+        "Run Keyword And Return Status",
+        "Run Keyword If All Critical Tests Passed",
+        "Run Keyword If All Tests Passed",
+        "Run Keyword If Any Critical Tests Failed",
+        "Run Keyword If Any Tests Failed",
+        "Run Keyword If Test Failed",
+        "Run Keyword If Test Passed",
+        "Run Keyword If Timeout Occurred",
+        "Run Keyword And Warn On Failure",
+    }
+)
 
 RUN_KEYWORD_WITH_CONDITION_NAMES: Dict[str, int] = {
     "Run Keyword And Expect Error": 1,
@@ -136,12 +139,14 @@ RUN_KEYWORD_IF_NAME = "Run Keyword If"
 
 RUN_KEYWORDS_NAME = "Run Keywords"
 
-ALL_RUN_KEYWORDS = [
-    *RUN_KEYWORD_NAMES,
-    *RUN_KEYWORD_WITH_CONDITION_NAMES.keys(),
-    RUN_KEYWORDS_NAME,
-    RUN_KEYWORD_IF_NAME,
-]
+ALL_RUN_KEYWORDS: FrozenSet[str] = frozenset(
+    {
+        *RUN_KEYWORD_NAMES,
+        *RUN_KEYWORD_WITH_CONDITION_NAMES.keys(),
+        RUN_KEYWORDS_NAME,
+        RUN_KEYWORD_IF_NAME,
+    }
+)
 
 BUILTIN_LIBRARY_NAME = "BuiltIn"
 RESERVED_LIBRARY_NAME = "Reserved"
@@ -524,7 +529,7 @@ class ArgumentSpec:
         dict_to_kwargs: bool = False,
         validate: bool = True,
     ) -> Tuple[List[Any], List[Tuple[str, Any]]]:
-        if not hasattr(self, "__robot_arguments"):
+        if not hasattr(self, "_ArgumentSpec__robot_arguments"):
             if get_robot_version() < (7, 0):
                 self.__robot_arguments = RobotArgumentSpec(
                     self.name,
@@ -652,7 +657,7 @@ class KeywordDoc(SourceEntity):
 
     @property
     def matcher(self) -> KeywordMatcher:
-        if not hasattr(self, "__matcher"):
+        if not hasattr(self, "_KeywordDoc__matcher"):
             self.__matcher = KeywordMatcher(self.name)
         return self.__matcher
 
@@ -833,6 +838,7 @@ class KeywordDoc(SourceEntity):
 
         return False
 
+    @single_call
     def is_any_run_keyword(self) -> bool:
         return self.libname == BUILTIN_LIBRARY_NAME and self.name in ALL_RUN_KEYWORDS
 
@@ -842,6 +848,7 @@ class KeywordDoc(SourceEntity):
     def is_run_keyword_with_condition(self) -> bool:
         return self.libname == BUILTIN_LIBRARY_NAME and self.name in RUN_KEYWORD_WITH_CONDITION_NAMES
 
+    @single_call
     def run_keyword_condition_count(self) -> int:
         return (
             RUN_KEYWORD_WITH_CONDITION_NAMES[self.name]
@@ -897,7 +904,7 @@ class KeywordStore:
 
     @property
     def _matchers(self) -> Dict[KeywordMatcher, KeywordDoc]:
-        if not hasattr(self, "__matchers"):
+        if not hasattr(self, "_KeywordStore__matchers"):
             self.__matchers = {v.matcher: v for v in self.keywords}
         return self.__matchers
 
@@ -2676,7 +2683,7 @@ def get_model_doc(
         arguments = arguments_node.get_tokens(RobotToken.ARGUMENT)
         argument_definitions = []
 
-        for argument_token in (cast(RobotToken, e) for e in arguments):
+        for argument_token in arguments:
             try:
                 argument = get_variable_token(argument_token)
 
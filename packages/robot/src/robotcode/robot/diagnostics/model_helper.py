@@ -7,6 +7,7 @@ from io import StringIO
 from tokenize import TokenError, generate_tokens
 from typing import (
     Any,
+    Dict,
     Iterator,
     List,
     Optional,
@@ -25,6 +26,7 @@ from robotcode.core.lsp.types import Position
 
 from ..utils import get_robot_version
 from ..utils.ast import (
+    is_position_in_token,
     iter_over_keyword_names_and_owners,
     range_from_token,
     strip_variable_token,
@@ -38,6 +40,10 @@ from .entities import (
     VariableNotFoundDefinition,
 )
 from .library_doc import (
+    RUN_KEYWORD_IF_NAME,
+    RUN_KEYWORD_NAMES,
+    RUN_KEYWORD_WITH_CONDITION_NAMES,
+    RUN_KEYWORDS_NAME,
     ArgumentInfo,
     KeywordArgumentKind,
     KeywordDoc,
@@ -45,6 +51,11 @@ from .library_doc import (
 )
 from .namespace import DEFAULT_BDD_PREFIXES, Namespace
 
+_RUN_KEYWORD_ARGUMENT_INDEXES: Dict[str, int] = {
+    **{name: 0 for name in RUN_KEYWORD_NAMES},
+    **RUN_KEYWORD_WITH_CONDITION_NAMES,
+}
+
 
 class ModelHelper:
     @classmethod
@@ -58,141 +69,158 @@ class ModelHelper:
         if keyword_doc is None or not keyword_doc.is_any_run_keyword():
             return None, argument_tokens
 
-        if keyword_doc.is_run_keyword() and len(argument_tokens) > 0:
-            result = cls.get_keyworddoc_and_token_from_position(
-                unescape(argument_tokens[0].value),
-                argument_tokens[0],
-                argument_tokens[1:],
-                namespace,
-                position,
+        keyword_index = _RUN_KEYWORD_ARGUMENT_INDEXES.get(keyword_doc.name)
+        if keyword_index is not None:
+            return cls._get_run_keyword_keyworddoc_and_token_from_position(
+                keyword_index, argument_tokens, namespace, position
             )
-            return result, argument_tokens[1:]
 
-        if keyword_doc.is_run_keyword_with_condition() and len(argument_tokens) > (
-            cond_count := keyword_doc.run_keyword_condition_count()
-        ):
-            result = cls.get_keyworddoc_and_token_from_position(
-                unescape(argument_tokens[cond_count].value),
-                argument_tokens[cond_count],
-                argument_tokens[cond_count + 1 :],
-                namespace,
-                position,
+        if keyword_doc.name == RUN_KEYWORDS_NAME:
+            return cls._get_run_keywords_keyworddoc_and_token_from_position(
+                keyword_doc, argument_tokens, namespace, position
             )
 
-            return result, argument_tokens[cond_count + 1 :]
-
-        if keyword_doc.is_run_keywords():
-            has_and = False
-            while argument_tokens:
-                t = argument_tokens[0]
-                argument_tokens = argument_tokens[1:]
-                if t.value == "AND":
-                    continue
-
-                and_token = next((e for e in argument_tokens if e.value == "AND"), None)
-                if and_token is not None:
-                    args = argument_tokens[: argument_tokens.index(and_token)]
-                    has_and = True
-                else:
-                    if has_and:
-                        args = argument_tokens
-                    else:
-                        args = []
-
-                result = cls.get_keyworddoc_and_token_from_position(unescape(t.value), t, args, namespace, position)
-                if result is not None and result[0] is not None:
-                    return result, []
-
-                if and_token is not None:
-                    argument_tokens = argument_tokens[argument_tokens.index(and_token) + 1 :]
-                elif has_and:
-                    argument_tokens = []
+        if keyword_doc.name == RUN_KEYWORD_IF_NAME:
+            return cls._get_run_keyword_if_keyworddoc_and_token_from_position(
+                keyword_doc, argument_tokens, namespace, position
+            )
 
-            return None, []
+        return None, argument_tokens
 
-        if keyword_doc.is_run_keyword_if() and len(argument_tokens) > 1:
+    @classmethod
+    def _get_run_keyword_keyworddoc_and_token_from_position(
+        cls,
+        keyword_index: int,
+        argument_tokens: List[Token],
+        namespace: Namespace,
+        position: Position,
+    ) -> Tuple[Optional[Tuple[Optional[KeywordDoc], Token]], List[Token]]:
+        if len(argument_tokens) > keyword_index:
+            result = cls.get_keyworddoc_and_token_from_position(
+                unescape(argument_tokens[keyword_index].value),
+                argument_tokens[keyword_index],
+                argument_tokens[keyword_index + 1 :],
+                namespace,
+                position,
+            )
 
-            def skip_args() -> None:
-                nonlocal argument_tokens
+            return result, argument_tokens[keyword_index + 1 :]
 
-                while argument_tokens:
-                    if argument_tokens[0].value in ["ELSE", "ELSE IF"]:
-                        break
-                    argument_tokens = argument_tokens[1:]
+        return None, argument_tokens
 
-            inner_keyword_doc = namespace.find_keyword(argument_tokens[1].value, raise_keyword_error=False)
+    @classmethod
+    def _get_run_keywords_keyworddoc_and_token_from_position(
+        cls,
+        keyword_doc: KeywordDoc,
+        argument_tokens: List[Token],
+        namespace: Namespace,
+        position: Position,
+    ) -> Tuple[Optional[Tuple[Optional[KeywordDoc], Token]], List[Token]]:
+        has_and = False
+        and_positions = [i for i, e in enumerate(argument_tokens) if e.value == "AND"]
+        next_and = 0
+        count = len(argument_tokens)
+        i = 0
+        while i < count:
+            t = argument_tokens[i]
+            i += 1
+            if t.value == "AND":
+                continue
+
+            while next_and < len(and_positions) and and_positions[next_and] < i:
+                next_and += 1
+
+            args = []
+            if next_and < len(and_positions):
+                args = argument_tokens[i : and_positions[next_and]]
+                i = and_positions[next_and] + 1
+                has_and = True
+            elif has_and:
+                args = argument_tokens[i:]
+                i = count
+
+            result = cls.get_keyworddoc_and_token_from_position(unescape(t.value), t, args, namespace, position)
+            if result is not None and result[0] is not None:
+                return result, []
+
+        return None, []
 
-            if position.is_in_range(range_from_token(argument_tokens[1])):
-                return (inner_keyword_doc, argument_tokens[1]), argument_tokens[2:]
+    @classmethod
+    def _get_run_keyword_if_keyworddoc_and_token_from_position(
+        cls,
+        keyword_doc: KeywordDoc,
+        argument_tokens: List[Token],
+        namespace: Namespace,
+        position: Position,
+    ) -> Tuple[Optional[Tuple[Optional[KeywordDoc], Token]], List[Token]]:
+        if len(argument_tokens) <= 1:
+            return None, argument_tokens
 
-            argument_tokens = argument_tokens[2:]
+        def skip_args(start: int) -> int:
+            while start < len(argument_tokens) and argument_tokens[start].value not in ["ELSE", "ELSE IF"]:
+                start += 1
+            return start
 
-            inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
-                inner_keyword_doc, argument_tokens, namespace, position
-            )
+        inner_keyword_doc = namespace.find_keyword(argument_tokens[1].value, raise_keyword_error=False)
 
-            if inner_keyword_doc_and_args[0] is not None:
-                return inner_keyword_doc_and_args
+        if is_position_in_token(position, argument_tokens[1]):
+            return (inner_keyword_doc, argument_tokens[1]), argument_tokens[2:]
 
-            argument_tokens = inner_keyword_doc_and_args[1]
+        inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
+            inner_keyword_doc, argument_tokens[2:], namespace, position
+        )
 
-            skip_args()
+        if inner_keyword_doc_and_args[0] is not None:
+            return inner_keyword_doc_and_args
 
-            while argument_tokens:
-                if argument_tokens[0].value == "ELSE" and len(argument_tokens) > 1:
-                    inner_keyword_doc = namespace.find_keyword(unescape(argument_tokens[1].value))
+        argument_tokens = inner_keyword_doc_and_args[1]
+        i = skip_args(0)
 
-                    if position.is_in_range(range_from_token(argument_tokens[1])):
-                        return (
-                            inner_keyword_doc,
-                            argument_tokens[1],
-                        ), argument_tokens[2:]
+        while i < len(argument_tokens):
+            if argument_tokens[i].value == "ELSE" and len(argument_tokens) - i > 1:
+                kwt = argument_tokens[i + 1]
+                inner_keyword_doc = namespace.find_keyword(unescape(kwt.value))
 
-                    argument_tokens = argument_tokens[2:]
+                if is_position_in_token(position, kwt):
+                    return (inner_keyword_doc, kwt), argument_tokens[i + 2 :]
 
-                    inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
-                        inner_keyword_doc,
-                        argument_tokens,
-                        namespace,
-                        position,
-                    )
+                inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
+                    inner_keyword_doc,
+                    argument_tokens[i + 2 :],
+                    namespace,
+                    position,
+                )
 
-                    if inner_keyword_doc_and_args[0] is not None:
-                        return inner_keyword_doc_and_args
+                if inner_keyword_doc_and_args[0] is not None:
+                    return inner_keyword_doc_and_args
 
-                    argument_tokens = inner_keyword_doc_and_args[1]
+                argument_tokens = inner_keyword_doc_and_args[1]
+                i = skip_args(0)
 
-                    skip_args()
+                break
+            if argument_tokens[i].value == "ELSE IF" and len(argument_tokens) - i > 2:
+                kwt = argument_tokens[i + 2]
+                inner_keyword_doc = namespace.find_keyword(unescape(kwt.value))
 
-                    break
-                if argument_tokens[0].value == "ELSE IF" and len(argument_tokens) > 2:
-                    inner_keyword_doc = namespace.find_keyword(unescape(argument_tokens[2].value))
-
-                    if position.is_in_range(range_from_token(argument_tokens[2])):
-                        return (
-                            inner_keyword_doc,
-                            argument_tokens[2],
-                        ), argument_tokens[3:]
-
-                    argument_tokens = argument_tokens[3:]
-
-                    inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
-                        inner_keyword_doc,
-                        argument_tokens,
-                        namespace,
-                        position,
-                    )
+                if is_position_in_token(position, kwt):
+                    return (inner_keyword_doc, kwt), argument_tokens[i + 3 :]
 
-                    if inner_keyword_doc_and_args[0] is not None:
-                        return inner_keyword_doc_and_args
+                inner_keyword_doc_and_args = cls.get_run_keyword_keyworddoc_and_token_from_position(
+                    inner_keyword_doc,
+                    argument_tokens[i + 3 :],
+                    namespace,
+                    position,
+                )
 
-                    argument_tokens = inner_keyword_doc_and_args[1]
+                if inner_keyword_doc_and_args[0] is not None:
+                    return inner_keyword_doc_and_args
 
-                    skip_args()
-                else:
-                    break
+                argument_tokens = inner_keyword_doc_and_args[1]
+                i = skip_args(0)
+            else:
+                break
 
-        return None, argument_tokens
+        return None, argument_tokens[i:]
 
     @classmethod
     def get_keyworddoc_and_token_from_position(
@@ -208,7 +236,7 @@ class ModelHelper:
         if keyword_doc is None:
             return None
 
-        if position.is_in_range(range_from_token(keyword_token)):
+        if is_position_in_token(position, keyword_token):
             return keyword_doc, keyword_token
 
         if analyse_run_keywords:
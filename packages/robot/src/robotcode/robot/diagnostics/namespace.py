@@ -1,4 +1,5 @@
 import ast
+import builtins
 import enum
 import itertools
 import re
@@ -11,6 +12,7 @@ from pathlib import Path
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -20,7 +22,6 @@ from typing import (
     Set,
     Tuple,
     Union,
-    cast,
 )
 
 from robot.errors import VariableError
@@ -477,8 +478,6 @@ class BlockVariableVisitor(Visitor):
                 )
 
     def visit_Var(self, node: Statement) -> None:  # noqa: N802
-        from robot.parsing.model.statements import Var
-
         variable = node.get_token(Token.VARIABLE)
         if variable is None:
             return
@@ -490,7 +489,7 @@ class BlockVariableVisitor(Visitor):
             if not is_variable(var_name):
                 return
 
-            scope = cast(Var, node).scope
+            scope = node.scope
 
             if scope in ("SUITE",):
                 var_type = VariableDefinition
@@ -664,6 +663,7 @@ class Namespace:
         self._library_doc_lock = RLock(default_timeout=120, name="Namespace.library_doc")
         self._imports: Optional[List[Import]] = None
         self._import_entries: Dict[Import, LibraryEntry] = OrderedDict()
+        self._import_entries_index: Optional[Dict[Tuple[Any, ...], LibraryEntry]] = None
         self._own_variables: Optional[List[VariableDefinition]] = None
         self._own_variables_lock = RLock(default_timeout=120, name="Namespace.own_variables")
         self._global_variables: Optional[List[VariableDefinition]] = None
@@ -695,7 +695,7 @@ class Namespace:
 
         self._in_initialize = False
 
-        self._ignored_lines: Optional[List[int]] = None
+        self._ignored_lines: Optional[FrozenSet[int]] = None
 
     @event
     def has_invalidated(sender) -> None: ...
@@ -1144,6 +1144,7 @@ class Namespace:
                 result.alias_range = value.alias_range
 
                 self._import_entries[value] = result
+                self._import_entries_index = None
 
                 if (
                     top_level
@@ -1195,6 +1196,7 @@ class Namespace:
                     result.import_source = value.source
 
                     self._import_entries[value] = result
+                    self._import_entries_index = None
 
                     if top_level and (
                         not result.library_doc.errors
@@ -1226,6 +1228,7 @@ class Namespace:
                 result.import_source = value.source
 
                 self._import_entries[value] = result
+                self._import_entries_index = None
             else:
                 raise DiagnosticsError("Unknown import type.")
 
@@ -1606,20 +1609,35 @@ class Namespace:
             alias=alias,
         )
 
+    def _get_import_entries_index(self) -> Dict[Tuple[Any, ...], LibraryEntry]:
+        self.ensure_initialized()
+
+        if self._import_entries_index is None:
+            index: Dict[Tuple[Any, ...], LibraryEntry] = {}
+
+            for e, v in self._import_entries.items():
+                if isinstance(e, LibraryImport):
+                    key: Tuple[Any, ...] = (LibraryImport, v.import_name, v.args, v.alias)
+                elif isinstance(e, ResourceImport):
+                    key = (ResourceImport, v.import_name)
+                elif isinstance(e, VariablesImport):
+                    key = (VariablesImport, v.import_name, v.args)
+                else:
+                    continue
+
+                index.setdefault(key, v)
+
+            self._import_entries_index = index
+
+        return self._import_entries_index
+
     @_logger.call
     def get_imported_library_libdoc(
         self, name: str, args: Tuple[str, ...] = (), alias: Optional[str] = None
     ) -> Optional[LibraryDoc]:
-        self.ensure_initialized()
+        entry = self._get_import_entries_index().get((LibraryImport, name, args, alias))
 
-        return next(
-            (
-                v.library_doc
-                for e, v in self._import_entries.items()
-                if isinstance(e, LibraryImport) and v.import_name == name and v.args == args and v.alias == alias
-            ),
-            None,
-        )
+        return entry.library_doc if entry is not None else None
 
     @_logger.call
     def _get_resource_entry(
@@ -1646,16 +1664,9 @@ class Namespace:
 
     @_logger.call
     def get_imported_resource_libdoc(self, name: str) -> Optional[LibraryDoc]:
-        self.ensure_initialized()
+        entry = self._get_import_entries_index().get((ResourceImport, name))
 
-        return next(
-            (
-                v.library_doc
-                for e, v in self._import_entries.items()
-                if isinstance(e, ResourceImport) and v.import_name == name
-            ),
-            None,
-        )
+        return entry.library_doc if entry is not None else None
 
     @_logger.call
     def _get_variables_entry(
@@ -1687,16 +1698,9 @@ class Namespace:
 
     @_logger.call
     def get_imported_variables_libdoc(self, name: str, args: Tuple[str, ...] = ()) -> Optional[LibraryDoc]:
-        self.ensure_initialized()
+        entry = self._get_import_entries_index().get((VariablesImport, name, args))
 
-        return next(
-            (
-                v.library_doc
-                for e, v in self._import_entries.items()
-                if isinstance(e, VariablesImport) and v.import_name == name and v.args == args
-            ),
-            None,
-        )
+        return entry.library_doc if entry is not None else None
 
     def get_imported_keywords(self) -> List[KeywordDoc]:
         with self._imported_keywords_lock:
@@ -1712,8 +1716,6 @@ class Namespace:
 
     @_logger.call
     def iter_all_keywords(self) -> Iterator[KeywordDoc]:
-        import itertools
-
         libdoc = self.get_library_doc()
 
         for doc in itertools.chain(
@@ -1786,8 +1788,6 @@ class Namespace:
 
     @_logger.call(condition=lambda self: not self._analyzed)
     def analyze(self) -> None:
-        import time
-
         from .namespace_analyzer import NamespaceAnalyzer
 
         with self._analyze_lock:
@@ -1804,7 +1804,7 @@ class Namespace:
                         self.model,
                         self,
                         self.create_finder(),
-                        self.get_ignored_lines(self.document) if self.document is not None else [],
+                        self.get_ignored_lines(self.document) if self.document is not None else frozenset(),
                     ).run()
 
                     self._diagnostics += result.diagnostics
@@ -1860,7 +1860,11 @@ class Namespace:
         self.ensure_initialized()
         return KeywordFinder(self, self.get_library_doc())
 
-    @_logger.call(condition=lambda self, name, **kwargs: self._finder is not None and name not in self._finder._cache)
+    @_logger.call(
+        condition=lambda self, name, **kwargs: (
+            self._finder is not None and (name, kwargs.get("handle_bdd_style", True)) not in self._finder._cache
+        )
+    )
     def find_keyword(
         self,
         name: Optional[str],
@@ -1877,38 +1881,46 @@ class Namespace:
         )
 
     @classmethod
-    def get_ignored_lines(cls, document: TextDocument) -> List[int]:
+    def get_ignored_lines(cls, document: TextDocument) -> FrozenSet[int]:
         return document.get_cache(cls.__get_ignored_lines)
 
     @staticmethod
-    def __get_ignored_lines(document: TextDocument) -> List[int]:
-        result = []
+    def __get_ignored_lines(document: TextDocument) -> FrozenSet[int]:
+        if "robotcode" not in document.text():
+            return frozenset()
+
+        result: Set[int] = set()
         lines = document.get_lines()
         for line_no, line in enumerate(lines):
+            if "robotcode" not in line:
+                continue
+
             comment = EXTRACT_COMMENT_PATTERN.match(line)
-            if comment and comment.group("comment"):
-                for match in ROBOTCODE_PATTERN.finditer(comment.group("comment")):
+            if comment and (comment_text := comment.group("comment")):
+                for match in ROBOTCODE_PATTERN.finditer(comment_text):
                     if match.group("rule") == "ignore":
-                        result.append(line_no)
+                        result.add(line_no)
+                        break
 
-        return result
+        return frozenset(result)
 
     @classmethod
     def should_ignore(cls, document: Optional[TextDocument], range: Range) -> bool:
-        return cls.__should_ignore(
-            cls.get_ignored_lines(document) if document is not None else [],
+        return cls.should_ignore_lines(
+            cls.get_ignored_lines(document) if document is not None else frozenset(),
             range,
         )
 
     def _should_ignore(self, range: Range) -> bool:
         if self._ignored_lines is None:
-            self._ignored_lines = self.get_ignored_lines(self.document) if self.document is not None else []
+            self._ignored_lines = self.get_ignored_lines(self.document) if self.document is not None else frozenset()
 
-        return self.__should_ignore(self._ignored_lines, range)
+        return self.should_ignore_lines(self._ignored_lines, range)
 
     @staticmethod
-    def __should_ignore(lines: List[int], range: Range) -> bool:
-        import builtins
+    def should_ignore_lines(lines: FrozenSet[int], range: Range) -> bool:
+        if not lines:
+            return False
 
         return any(line_no in lines for line_no in builtins.range(range.start.line, range.end.line + 1))
 
@@ -1957,18 +1969,18 @@ class KeywordFinder:
         raise_keyword_error: bool = False,
         handle_bdd_style: bool = True,
     ) -> Optional[KeywordDoc]:
-        try:
-            self.reset_diagnostics()
+        self.handle_bdd_style = handle_bdd_style
 
-            self.handle_bdd_style = handle_bdd_style
+        cached = self._cache.get((name, handle_bdd_style), None)
 
-            cached = self._cache.get((name, self.handle_bdd_style), None)
+        if cached is not None:
+            self.diagnostics = cached[1]
+            self.multiple_keywords_result = cached[2]
+            return cached[0]
 
-            if cached is not None:
-                self.diagnostics = cached[1]
-                self.multiple_keywords_result = cached[2]
-                return cached[0]
+        self.reset_diagnostics()
 
+        try:
             try:
                 result = self._find_keyword(name)
                 if result is None:
@@ -1989,7 +2001,7 @@ class KeywordFinder:
                 result = None
                 self.diagnostics.append(DiagnosticsEntry(str(e), DiagnosticSeverity.ERROR, Error.KEYWORD_ERROR))
 
-            self._cache[(name, self.handle_bdd_style)] = (
+            self._cache[(name, handle_bdd_style)] = (
                 result,
                 self.diagnostics,
                 self.multiple_keywords_result,
@@ -1997,6 +2009,12 @@ class KeywordFinder:
 
             return result
         except CancelSearchError:
+            self._cache[(name, handle_bdd_style)] = (
+                None,
+                self.diagnostics,
+                self.multiple_keywords_result,
+            )
+
             return None
 
     def _find_keyword(self, name: Optional[str]) -> Optional[KeywordDoc]:
@@ -5,7 +5,7 @@ import itertools
 import os
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type, Union
 
 import robot.parsing.model.statements
 from robot.parsing.lexer.tokens import Token
@@ -73,6 +73,22 @@ if get_robot_version() < (7, 0):
 else:
     from robot.variables.search import VariableMatches
 
+EXPRESSION_KEYWORDS = frozenset(
+    {
+        "BuiltIn.Evaluate",
+        "BuiltIn.Should Be True",
+        "BuiltIn.Should Not Be True",
+        "BuiltIn.Skip If",
+        "BuiltIn.Continue For Loop If",
+        "BuiltIn.Exit For Loop If",
+        "BuiltIn.Return From Keyword If",
+        "BuiltIn.Run Keyword And Return If",
+        "BuiltIn.Pass Execution If",
+        "BuiltIn.Run Keyword If",
+        "BuiltIn.Run Keyword Unless",
+    }
+)
+
 
 @dataclass
 class AnalyzerResult:
@@ -89,7 +105,7 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
         model: ast.AST,
         namespace: Namespace,
         finder: KeywordFinder,
-        ignored_lines: List[int],
+        ignored_lines: FrozenSet[int],
     ) -> None:
         super().__init__()
 
@@ -251,11 +267,6 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                     if self.namespace.document is not None:
                         self._variable_references[var_def] = set()
 
-    def generic_visit(self, node: ast.AST) -> None:
-        check_current_task_canceled()
-
-        super().generic_visit(node)
-
     if get_robot_version() < (7, 0):
         variable_statements: Tuple[Type[Any], ...] = (Variable,)
     else:
@@ -398,7 +409,7 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                                 self._variable_references[var].add(
                                     Location(
                                         self.namespace.document.document_uri,
-                                        range_from_token(var_token),
+                                        var_range,
                                     )
                                 )
 
@@ -412,22 +423,16 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                                         self._variable_references[suite_var].add(
                                             Location(
                                                 self.namespace.document.document_uri,
-                                                range_from_token(var_token),
+                                                var_range,
                                             )
                                         )
 
             super().visit(node)
         finally:
-            self.node_stack = self.node_stack[:-1]
+            self.node_stack.pop()
 
     def _should_ignore(self, range: Range) -> bool:
-        import builtins
-
-        for line_no in builtins.range(range.start.line, range.end.line + 1):
-            if line_no in self._ignored_lines:
-                return True
-
-        return False
+        return Namespace.should_ignore_lines(self._ignored_lines, range)
 
     def append_diagnostics(
         self,
@@ -458,6 +463,14 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
             )
         )
 
+    def _append_exception_diagnostics(self, range: Range, e: BaseException) -> None:
+        self.append_diagnostics(
+            range=range,
+            message=str(e),
+            severity=DiagnosticSeverity.ERROR,
+            code=type(e).__qualname__,
+        )
+
     def _analyze_keyword_call(
         self,
         keyword: Optional[str],
@@ -543,36 +556,28 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                 if self.namespace.document is not None:
                     self._keyword_references[result].add(Location(self.namespace.document.document_uri, kw_range))
 
-                if result.errors:
-                    self.append_diagnostics(
-                        range=kw_range,
-                        message="Keyword definition contains errors.",
-                        severity=DiagnosticSeverity.ERROR,
-                        related_information=[
+                if result.errors and not self._should_ignore(kw_range):
+                    result_uri = str(Uri.from_path(result.source if result.source is not None else "/<unknown>"))
+                    result_line_no = max(result.line_no, 0)
+
+                    related_information = []
+                    for err in result.errors:
+                        line = err.line_no - 1 if err.line_no is not None else result_line_no
+                        related_information.append(
                             DiagnosticRelatedInformation(
                                 location=Location(
-                                    uri=str(
-                                        Uri.from_path(
-                                            err.source
-                                            if err.source is not None
-                                            else result.source if result.source is not None else "/<unknown>"
-                                        )
-                                    ),
-                                    range=Range(
-                                        start=Position(
-                                            line=err.line_no - 1 if err.line_no is not None else max(result.line_no, 0),
-                                            character=0,
-                                        ),
-                                        end=Position(
-                                            line=err.line_no - 1 if err.line_no is not None else max(result.line_no, 0),
-                                            character=0,
-                                        ),
-                                    ),
+                                    uri=str(Uri.from_path(err.source)) if err.source is not None else result_uri,
+                                    range=Range(Position(line, 0), Position(line, 0)),
                                 ),
                                 message=err.message,
                             )
-                            for err in result.errors
-                        ],
+                        )
+
+                    self.append_diagnostics(
+                        range=kw_range,
+                        message="Keyword definition contains errors.",
+                        severity=DiagnosticSeverity.ERROR,
+                        related_information=related_information,
                     )
 
                 if result.is_deprecated:
@@ -621,40 +626,21 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                     except (SystemExit, KeyboardInterrupt):
                         raise
                     except BaseException as e:
-                        self.append_diagnostics(
-                            range=Range(
+                        self._append_exception_diagnostics(
+                            Range(
                                 start=kw_range.start,
                                 end=range_from_token(argument_tokens[-1]).end if argument_tokens else kw_range.end,
                             ),
-                            message=str(e),
-                            severity=DiagnosticSeverity.ERROR,
-                            code=type(e).__qualname__,
+                            e,
                         )
 
         except (SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
-            self.append_diagnostics(
-                range=range_from_node_or_token(node, keyword_token),
-                message=str(e),
-                severity=DiagnosticSeverity.ERROR,
-                code=type(e).__qualname__,
-            )
+            self._append_exception_diagnostics(range_from_node_or_token(node, keyword_token), e)
 
         if self.namespace.document is not None and result is not None:
-            if result.longname in [
-                "BuiltIn.Evaluate",
-                "BuiltIn.Should Be True",
-                "BuiltIn.Should Not Be True",
-                "BuiltIn.Skip If",
-                "BuiltIn.Continue For Loop If",
-                "BuiltIn.Exit For Loop If",
-                "BuiltIn.Return From Keyword If",
-                "BuiltIn.Run Keyword And Return If",
-                "BuiltIn.Pass Execution If",
-                "BuiltIn.Run Keyword If",
-                "BuiltIn.Run Keyword Unless",
-            ]:
+            if result.longname in EXPRESSION_KEYWORDS:
                 tokens = argument_tokens
                 if tokens and (token := tokens[0]):
                     for (
@@ -668,9 +654,10 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                         skip_commandline_variables=False,
                         return_not_found=True,
                     ):
+                        var_range = range_from_token(var_token)
                         if isinstance(var, VariableNotFoundDefinition):
                             self.append_diagnostics(
-                                range=range_from_token(var_token),
+                                range=var_range,
                                 message=f"Variable '{var.name}' not found.",
                                 severity=DiagnosticSeverity.ERROR,
                                 code=Error.VARIABLE_NOT_FOUND,
@@ -680,7 +667,7 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                                 self._variable_references[var].add(
                                     Location(
                                         self.namespace.document.document_uri,
-                                        range_from_token(var_token),
+                                        var_range,
                                     )
                                 )
 
@@ -694,7 +681,7 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                                         self._variable_references[suite_var].add(
                                             Location(
                                                 self.namespace.document.document_uri,
-                                                range_from_token(var_token),
+                                                var_range,
                                             )
                                         )
             if result.argument_definitions:
@@ -755,9 +742,13 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
 
         if keyword_doc.is_run_keywords():
             has_and = False
-            while argument_tokens:
-                t = argument_tokens[0]
-                argument_tokens = argument_tokens[1:]
+            and_positions = [i for i, e in enumerate(argument_tokens) if e.value == "AND"]
+            next_and = 0
+            count = len(argument_tokens)
+            i = 0
+            while i < count:
+                t = argument_tokens[i]
+                i += 1
                 if t.value == "AND":
                     self.append_diagnostics(
                         range=range_from_token(t),
@@ -767,15 +758,17 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                     )
                     continue
 
-                and_token = next((e for e in argument_tokens if e.value == "AND"), None)
+                while next_and < len(and_positions) and and_positions[next_and] < i:
+                    next_and += 1
+
                 args = []
-                if and_token is not None:
-                    args = argument_tokens[: argument_tokens.index(and_token)]
-                    argument_tokens = argument_tokens[argument_tokens.index(and_token) + 1 :]
+                if next_and < len(and_positions):
+                    args = argument_tokens[i : and_positions[next_and]]
+                    i = and_positions[next_and] + 1
                     has_and = True
                 elif has_and:
-                    args = argument_tokens
-                    argument_tokens = []
+                    args = argument_tokens[i:]
+                    i = count
 
                 self._analyze_keyword_call(
                     unescape(t.value),
@@ -790,79 +783,71 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
 
         if keyword_doc.is_run_keyword_if() and len(argument_tokens) > 1:
 
-            def skip_args() -> List[Token]:
-                nonlocal argument_tokens
-                result = []
-                while argument_tokens:
-                    if argument_tokens[0].value in ["ELSE", "ELSE IF"]:
-                        break
-                    if argument_tokens:
-                        result.append(argument_tokens[0])
-                    argument_tokens = argument_tokens[1:]
-
-                return result
+            def skip_args(start: int) -> int:
+                while start < len(argument_tokens) and argument_tokens[start].value not in ["ELSE", "ELSE IF"]:
+                    start += 1
+                return start
 
+            i = 0
             result = self.finder.find_keyword(argument_tokens[1].value)
 
             if result is not None and result.is_any_run_keyword():
-                argument_tokens = argument_tokens[2:]
-
-                argument_tokens = self._analyse_run_keyword(result, node, argument_tokens)
+                argument_tokens = self._analyse_run_keyword(result, node, argument_tokens[2:])
             else:
                 kwt = argument_tokens[1]
-                argument_tokens = argument_tokens[2:]
-
-                args = skip_args()
+                i = skip_args(2)
 
                 self._analyze_keyword_call(
                     unescape(kwt.value),
                     node,
                     kwt,
-                    args,
+                    argument_tokens[2:i],
                     analyse_run_keywords=False,
                     allow_variables=True,
                     ignore_errors_if_contains_variables=True,
                 )
 
-            while argument_tokens:
-                if argument_tokens[0].value == "ELSE" and len(argument_tokens) > 1:
-                    kwt = argument_tokens[1]
-                    argument_tokens = argument_tokens[2:]
-
-                    args = skip_args()
+            while i < len(argument_tokens):
+                if argument_tokens[i].value == "ELSE" and len(argument_tokens) - i > 1:
+                    kwt = argument_tokens[i + 1]
+                    args_start = i + 2
+                    i = skip_args(args_start)
 
                     result = self._analyze_keyword_call(
                         unescape(kwt.value),
                         node,
                         kwt,
-                        args,
+                        argument_tokens[args_start:i],
                         analyse_run_keywords=False,
                     )
 
                     if result is not None and result.is_any_run_keyword():
-                        argument_tokens = self._analyse_run_keyword(result, node, argument_tokens)
+                        argument_tokens = self._analyse_run_keyword(result, node, argument_tokens[i:])
+                        i = 0
 
                     break
 
-                if argument_tokens[0].value == "ELSE IF" and len(argument_tokens) > 2:
-                    kwt = argument_tokens[2]
-                    argument_tokens = argument_tokens[3:]
-
-                    args = skip_args()
+                if argument_tokens[i].value == "ELSE IF" and len(argument_tokens) - i > 2:
+                    kwt = argument_tokens[i + 2]
+                    args_start = i + 3
+                    i = skip_args(args_start)
 
                     result = self._analyze_keyword_call(
                         unescape(kwt.value),
                         node,
                         kwt,
-                        args,
+                        argument_tokens[args_start:i],
                         analyse_run_keywords=False,
                     )
 
                     if result is not None and result.is_any_run_keyword():
-                        argument_tokens = self._analyse_run_keyword(result, node, argument_tokens)
+                        argument_tokens = self._analyse_run_keyword(result, node, argument_tokens[i:])
+                        i = 0
                 else:
                     break
 
+            return argument_tokens[i:]
+
         return argument_tokens
 
     def visit_Fixture(self, node: Fixture) -> None:  # noqa: N802
@@ -876,10 +861,10 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
             and keyword_token.value.upper() not in ("", "NONE")
         ):
             self._analyze_keyword_call(
-                node.name,
+                keyword_token.value,
                 node,
                 keyword_token,
-                [e for e in node.get_tokens(Token.ARGUMENT)],
+                node.get_tokens(Token.ARGUMENT),
                 allow_variables=True,
                 ignore_errors_if_contains_variables=True,
             )
@@ -924,26 +909,36 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
         self.generic_visit(node)
 
     def visit_KeywordCall(self, node: KeywordCall) -> None:  # noqa: N802
-        keyword_token = node.get_token(Token.KEYWORD)
-
-        if node.assign and keyword_token is None:
+        keyword_token: Optional[Token] = None
+        assign_token: Optional[Token] = None
+        argument_tokens: List[Token] = []
+        for token in node.tokens:
+            if token.type == Token.ARGUMENT:
+                argument_tokens.append(token)
+            elif token.type == Token.KEYWORD:
+                if keyword_token is None:
+                    keyword_token = token
+            elif token.type == Token.ASSIGN and assign_token is None:
+                assign_token = token
+
+        if assign_token is not None and keyword_token is None:
             self.append_diagnostics(
-                range=range_from_node_or_token(node, node.get_token(Token.ASSIGN)),
+                range=range_from_node_or_token(node, assign_token),
                 message="Keyword name cannot be empty.",
                 severity=DiagnosticSeverity.ERROR,
                 code=Error.KEYWORD_NAME_EMPTY,
             )
         else:
             self._analyze_keyword_call(
-                node.keyword,
+                keyword_token.value if keyword_token is not None else node.keyword,
                 node,
                 keyword_token,
-                [e for e in node.get_tokens(Token.ARGUMENT)],
+                argument_tokens,
             )
 
         if not self.current_testcase_or_keyword_name:
             self.append_diagnostics(
-                range=range_from_node_or_token(node, node.get_token(Token.ASSIGN)),
+                range=range_from_node_or_token(node, assign_token),
                 message="Code is unreachable.",
                 severity=DiagnosticSeverity.HINT,
                 tags=[DiagnosticTag.UNNECESSARY],
@@ -979,8 +974,9 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
 
             if (
                 get_robot_version() < (6, 1)
+                and "{" in node.name
                 and is_embedded_keyword(node.name)
-                and any(isinstance(v, Arguments) and len(v.values) > 0 for v in node.body)
+                and any(isinstance(v, Arguments) and v.values for v in node.body)
             ):
                 self.append_diagnostics(
                     range=range_from_node_or_token(node, name_token),
@@ -1033,6 +1029,8 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
             keyword = template.value
             keyword, args = self._format_template(keyword, args)
 
+            node_range: Optional[Range] = None
+
             result = self.finder.find_keyword(keyword)
             if result is not None:
                 try:
@@ -1046,21 +1044,21 @@ class NamespaceAnalyzer(Visitor, ModelHelper):
                 except (SystemExit, KeyboardInterrupt):
                     raise
                 except BaseException as e:
+                    node_range = range_from_node(node, skip_non_data=True)
+                    self._append_exception_diagnostics(node_range, e)
+
+            if self.finder.diagnostics:
+                if node_range is None:
+                    node_range = range_from_node(node, skip_non_data=True)
+
+                for d in self.finder.diagnostics:
                     self.append_diagnostics(
-                        range=range_from_node(node, skip_non_data=True),
-                        message=str(e),
-                        severity=DiagnosticSeverity.ERROR,
-                        code=type(e).__qualname__,
+                        range=node_range,
+                        message=d.message,
+                        severity=d.severity,
+                        code=d.code,
                     )
 
-            for d in self.finder.diagnostics:
-                self.append_diagnostics(
-                    range=range_from_node(node, skip_non_data=True),
-                    message=d.message,
-                    severity=d.severity,
-                    code=d.code,
-                )
-
         self.generic_visit(node)
 
     def visit_ForceTags(self, node: Statement) -> None:  # noqa: N802
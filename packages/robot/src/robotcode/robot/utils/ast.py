@@ -18,19 +18,35 @@ else:
     from robot.variables.search import VariableMatches as VariableIterator
 
 
-def iter_nodes(node: ast.AST, descendants: bool = True) -> Iterator[ast.AST]:
+def _child_nodes(node: ast.AST) -> List[ast.AST]:
+    result: List[ast.AST] = []
     for _field, value in ast.iter_fields(node):
         if isinstance(value, list):
             for item in value:
                 if isinstance(item, ast.AST):
-                    yield item
-                    if descendants:
-                        yield from iter_nodes(item)
+                    result.append(item)
 
         elif isinstance(value, ast.AST):
-            yield value
-            if descendants:
-                yield from iter_nodes(value)
+            result.append(value)
+
+    return result
+
+
+def iter_nodes(node: ast.AST, descendants: bool = True) -> Iterator[ast.AST]:
+    if not descendants:
+        yield from _child_nodes(node)
+        return
+
+    stack = _child_nodes(node)
+    stack.reverse()
+    while stack:
+        n = stack.pop()
+        yield n
+
+        children = _child_nodes(n)
+        if children:
+            children.reverse()
+            stack.extend(children)
 
 
 def range_from_token(token: Token) -> Range:
@@ -147,6 +163,34 @@ def node_in_range(node: ast.AST, range: Range, include_end: bool = False) -> boo
     return node_range.start.is_in_range(range, include_end) or node_range.end.is_in_range(range, include_end)
 
 
+def is_position_in_token(position: Position, token: Token, include_end: bool = True) -> bool:
+    character = position.character
+    if position.line != token.lineno - 1 or character < token.col_offset:
+        return False
+
+    end_character: int = token.end_col_offset
+    if include_end:
+        return character <= end_character
+    return character < end_character
+
+
+def is_position_in_node(position: Position, node: ast.AST, include_end: bool = True) -> bool:
+    # ast.AST does not declare the position attributes, robot's model nodes provide them
+    n: Any = node
+    line = position.line
+    character = position.character
+
+    start_line: int = n.lineno - 1
+    if line < start_line or (line == start_line and character < n.col_offset):
+        return False
+
+    end_line: int = n.end_lineno - 1 if n.end_lineno is not None else -1
+    end_character: int = n.end_col_offset if n.end_col_offset is not None else -1
+    if include_end:
+        return line < end_line or (line == end_line and character <= end_character)
+    return line < end_line or (line == end_line and character < end_character)
+
+
 def range_from_node_or_token(node: Optional[ast.AST], token: Optional[Token]) -> Range:
     if token is not None:
         return range_from_token(token)
@@ -156,6 +200,9 @@ def range_from_node_or_token(node: Optional[ast.AST], token: Optional[Token]) ->
 
 
 def is_not_variable_token(token: Token) -> bool:
+    if isinstance(token.value, str) and "{" not in token.value:
+        return True
+
     try:
         r = list(token.tokenize_variables())
         if len(r) == 1 and r[0] == token:
@@ -193,20 +240,21 @@ def whitespace_from_begin_of_token(token: Token) -> str:
 
 
 def get_tokens_at_position(node: Statement, position: Position, include_end: bool = False) -> List[Token]:
-    return [
-        t
-        for t in node.tokens
-        if position.is_in_range(range := range_from_token(t), include_end) or include_end and range.end == position
-    ]
+    return [t for t in node.tokens if is_position_in_token(position, t, include_end)]
+
+
+def _iter_child_nodes_at_position(node: ast.AST, position: Position, include_end: bool) -> Iterator[ast.AST]:
+    for n in iter_nodes(node, descendants=False):
+        if is_position_in_node(position, n, include_end):
+            yield n
+            yield from _iter_child_nodes_at_position(n, position, include_end)
 
 
 def iter_nodes_at_position(node: ast.AST, position: Position, include_end: bool = False) -> Iterator[ast.AST]:
-    if position.is_in_range(range_from_node(node), include_end):
+    if is_position_in_node(position, node, include_end):
         yield node
 
-    for n in iter_nodes(node):
-        if position.is_in_range(range := range_from_node(n), include_end) or include_end and range.end == position:
-            yield n
+    yield from _iter_child_nodes_at_position(node, position, include_end)
 
 
 def get_nodes_at_position(node: ast.AST, position: Position, include_end: bool = False) -> List[ast.AST]:
@@ -214,11 +262,18 @@ def get_nodes_at_position(node: ast.AST, position: Position, include_end: bool =
 
 
 def get_node_at_position(node: ast.AST, position: Position, include_end: bool = False) -> Optional[ast.AST]:
-    result_nodes = get_nodes_at_position(node, position, include_end)
-    if not result_nodes:
-        return None
+    result = node if is_position_in_node(position, node, include_end) else None
+
+    while True:
+        last = None
+        for n in iter_nodes(node, descendants=False):
+            if is_position_in_node(position, n, include_end):
+                last = n
+
+        if last is None:
+            return result
 
-    return result_nodes[-1]
+        result = node = last
 
 
 def _tokenize_no_variables(token: Token) -> Iterator[Token]:
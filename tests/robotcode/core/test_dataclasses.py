@@ -208,6 +208,8 @@ def test_encode_with_optional_field_and_none_as_default_value() -> None:
         ("[]", (int, str, List[int]), []),
         ("[1]", (int, List[int]), [1]),
         ("1", Any, 1),
+        ('[1, "a", {"b": [null]}]', List[Any], [1, "a", {"b": [None]}]),
+        ('[1, "a"]', Optional[List[Any]], [1, "a"]),
         ("[]", Union[int, str, List[int]], []),
         ('"first"', EnumData, EnumData.FIRST),
         ('"second"', EnumData, EnumData.SECOND),
@@ -244,6 +246,7 @@ def test_decode_simple(expr: Any, type: Any, expected: str) -> None:
             Dict[str, Dict[str, Any]],
             {"a": {}, "b": {"a": 2}},
         ),
+        ('{"a": [1, {"b": null}]}', Dict[str, Any], {"a": [1, {"b": None}]}),
     ],
 )
 def test_decode_dict(expr: Any, type: Any, expected: str) -> None:
@@ -458,6 +461,34 @@ def test_decode_with_some_unambigous_fields_should_raise_typeerror() -> None:
         from_json('{"a":1, "b": 2}', (SimpleItem, SimpleItem2))
 
 
+@dataclass
+class NestedSimpleItems:
+    first: SimpleItem
+    second_item: SimpleItem
+    name: str
+
+
+@pytest.mark.parametrize(
+    ("expr", "type", "expected"),
+    [
+        (
+            '{"first": {"a": 1, "b": 2}, "second_item": {"a": 3, "b": 4}, "name": "x"}',
+            NestedSimpleItems,
+            NestedSimpleItems(SimpleItem(1, 2), SimpleItem(3, 4), "x"),
+        ),
+        ('{"a": 1, "b": 2, "c": 3}', SimpleItem, SimpleItem(1, 2)),
+        ('{"a": true, "b": 2}', SimpleItem, SimpleItem(True, 2)),
+    ],
+)
+def test_decode_simple_records(expr: Any, type: Any, expected: Any) -> None:
+    assert from_json(expr, type) == expected
+
+
+def test_decode_simple_records_with_invalid_field_should_raise_typeerror() -> None:
+    with pytest.raises(TypeError, match=r"first\.b"):
+        from_json('{"first": {"a": 1, "b": "2"}, "second_item": {"a": 3, "b": 4}, "name": "x"}', NestedSimpleItems)
+
+
 @dataclass
 class ComplexItemWithUnionTypeWithSimpleAndComplexTypes:
     a_union_field: Union[bool, SimpleItem, SimpleItem1]
@@ -576,6 +607,7 @@ def test_decode_strict_with_invalid_data_should_raise_typeerror(expr: Any, type:
         ('"bluff"', Literal["test", "blah", "bluff"], "bluff"),
         ('"dada"', (Literal["test", "blah", "bluff"], str), "dada"),
         ("1", (Literal["test", "blah", "bluff"], int), 1),
+        ('{"a": 1}', (Literal["test", "blah", "bluff"], Dict[str, int]), {"a": 1}),
     ],
 )
 def test_literal_should_work(expr: Any, type: Any, expected: str) -> None:
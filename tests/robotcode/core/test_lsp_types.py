@@ -0,0 +1,52 @@
+import itertools
+from typing import Tuple
+
+import pytest
+
+from robotcode.core.lsp.types import Location, Position, Range
+
+POSITIONS = [(line, character) for line in range(3) for character in range(3)]
+
+
+@pytest.mark.parametrize(("a", "b"), list(itertools.product(POSITIONS, POSITIONS)))
+def test_position_compare_like_tuples(a: Tuple[int, int], b: Tuple[int, int]) -> None:
+    pa = Position(*a)
+    pb = Position(*b)
+
+    assert (pa == pb) == (a == b)
+    assert (pa != pb) == (a != b)
+    assert (pa < pb) == (a < b)
+    assert (pa <= pb) == (a <= b)
+    assert (pa > pb) == (a > b)
+    assert (pa >= pb) == (a >= b)
+
+
+def test_position_compare_with_other_types() -> None:
+    assert Position(1, 1) != (1, 1)
+
+    with pytest.raises(TypeError):
+        assert Position(1, 1) < (1, 1)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ("position", "include_end", "expected"),
+    [
+        (Position(1, 0), True, False),
+        (Position(1, 2), True, True),
+        (Position(2, 0), True, True),
+        (Position(3, 4), True, True),
+        (Position(3, 4), False, False),
+        (Position(3, 5), True, False),
+    ],
+)
+def test_position_is_in_range(position: Position, include_end: bool, expected: bool) -> None:
+    assert position.is_in_range(Range(Position(1, 2), Position(3, 4)), include_end) == expected
+
+
+def test_equal_ranges_and_locations_have_equal_hashes() -> None:
+    range1 = Range(Position(1, 2), Position(3, 4))
+    range2 = Range(Position(1, 2), Position(3, 4))
+
+    assert hash(range1) == hash(range2)
+    assert hash(Location("file:///a", range1)) == hash(Location("file:///a", range2))
+    assert len({Location("file:///a", range1), Location("file:///a", range2), Location("file:///b", range1)}) == 2
@@ -3,7 +3,13 @@ from pathlib import Path
 import pytest
 import yaml
 
-from robotcode.core.lsp.types import Position
+from robotcode.core.lsp.types import (
+    LocationLink,
+    Position,
+    Range,
+    TextDocumentIdentifier,
+    TextDocumentItem,
+)
 from robotcode.core.text_document import TextDocument
 from robotcode.language_server.robotframework.protocol import (
     RobotLanguageServerProtocol,
@@ -38,3 +44,36 @@ def test_definition(
     )
 
     regtest.write(yaml.dump({"data": data, "result": split(result)}))
+
+
+def test_repeated_definition_returns_utf16_ranges(protocol: RobotLanguageServerProtocol) -> None:
+    uri = Path(Path(__file__).parent, "data/tests/goto_utf16.robot").as_uri()
+    protocol.documents._text_document_did_open(
+        TextDocumentItem(
+            uri=uri,
+            language_id="robotframework",
+            version=1,
+            text="*** Test Cases ***\nfirst\n    \U0001f600\U0001f600 Keyword Name\n\n"
+            "*** Keywords ***\n\U0001f600\U0001f600 Keyword Name\n    No Operation\n",
+        )
+    )
+    link_support = protocol.definition.link_support
+    protocol.definition.link_support = True
+    try:
+        expected = [
+            LocationLink(
+                origin_selection_range=Range(start=Position(line=2, character=4), end=Position(line=2, character=21)),
+                target_uri=uri,
+                target_range=Range(start=Position(line=5, character=0), end=Position(line=5, character=17)),
+                target_selection_range=Range(start=Position(line=5, character=0), end=Position(line=5, character=17)),
+            )
+        ]
+
+        for _ in range(2):
+            result = protocol.definition._text_document_definition(
+                TextDocumentIdentifier(uri=uri), Position(line=2, character=10)
+            )
+            assert result == expected
+    finally:
+        protocol.definition.link_support = link_support
+        protocol.documents._text_document_did_close(TextDocumentIdentifier(uri=uri))
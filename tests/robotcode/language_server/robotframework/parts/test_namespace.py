@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from robotcode.core.lsp.types import TextDocumentIdentifier, TextDocumentItem
+from robotcode.language_server.robotframework.protocol import (
+    RobotLanguageServerProtocol,
+)
+from robotcode.robot.diagnostics.entities import LibraryImport
+
+
+def test_imported_library_libdoc_sees_entries_added_after_lookup(protocol: RobotLanguageServerProtocol) -> None:
+    path = Path(Path(__file__).parent, "data/tests/namespace_imports.robot")
+    uri = path.as_uri()
+    protocol.documents._text_document_did_open(
+        TextDocumentItem(
+            uri=uri,
+            language_id="robotframework",
+            version=1,
+            text="*** Settings ***\nLibrary    Collections\n",
+        )
+    )
+    try:
+        document = protocol.documents.get(uri)
+        assert document is not None
+
+        namespace = protocol.documents_cache.get_namespace(document)
+
+        assert namespace.get_imported_library_libdoc("Collections") is not None
+        assert namespace.get_imported_library_libdoc("String") is None
+
+        namespace._import(
+            LibraryImport(
+                line_no=3,
+                col_offset=0,
+                end_line_no=3,
+                end_col_offset=17,
+                source=str(path),
+                name="String",
+                name_token=None,
+            ),
+            variables=None,
+            base_dir=str(path.parent),
+        )
+
+        libdoc = namespace.get_imported_library_libdoc("String")
+        assert libdoc is not None
+        assert libdoc.name == "String"
+    finally:
+        protocol.documents._text_document_did_close(TextDocumentIdentifier(uri=uri))